@@ -33,8 +33,9 @@ import time
 from adafruit_portalbase import PortalBase
 
 from adafruit_funhouse.graphics import Graphics
-from adafruit_funhouse.network import Network
 from adafruit_funhouse.peripherals import Peripherals
+from adafruit_funhouse.scheduler import Scheduler, Task
+from adafruit_funhouse.telemetry import StoreAndForward
 
 try:
     from typing import Callable, Dict, List, Optional, Sequence, Union
@@ -67,6 +68,23 @@ class FunHouse(PortalBase):
                      portrait/rotated
     :param scale: Default scale is 1, but can be an integer of 1 or greater
     :param debug: Turn on debug print outs. Defaults to False.
+    :param bool network: Create the `Network` object. Set to ``False`` for offline
+                         applications to skip loading the WiFi, SSL, requests and MQTT
+                         modules, which creating a `Network` always loads. Defaults to
+                         ``True``.
+    :param float aht20_max_age: The number of seconds a temperature and humidity reading is
+                                reused. Defaults to 0, to always read the sensor.
+    :param float dps310_max_age: The number of seconds a pressure reading is reused.
+                                 Defaults to 0, to always read the sensor.
+    :param float light_max_age: The number of seconds a light reading is reused.
+                                Defaults to 0, to always read the sensor.
+    :param bool calibrate_touch: Measure the baseline of every touch pad at startup, see
+                                 :py:class:`~adafruit_funhouse.peripherals.Peripherals`.
+                                 Defaults to ``False``.
+    :param enable: The names of the peripherals that may be used, from
+                   :py:data:`~adafruit_funhouse.peripherals.PERIPHERALS`. Defaults to
+                   ``None``, to allow all of them.
+    :param disable: The names of peripherals that may not be used. Defaults to none.
 
     """
 
@@ -83,12 +101,24 @@ class FunHouse(PortalBase):
         rotation: int = 270,
         scale: int = 1,
         debug: bool = False,
+        network: bool = True,
+        aht20_max_age: float = 0,
+        dps310_max_age: float = 0,
+        light_max_age: float = 0,
+        calibrate_touch: bool = False,
+        enable: Optional[Sequence[str]] = None,
+        disable: Sequence[str] = (),
     ) -> None:
-        network = Network(
-            status_dotstar=status_dotstar,
-            extract_values=False,
-            debug=debug,
-        )
+        if network:
+            from adafruit_funhouse.network import Network
+
+            network = Network(
+                status_dotstar=status_dotstar,
+                extract_values=False,
+                debug=debug,
+            )
+        else:
+            network = None
 
         graphics = Graphics(
             default_bg=default_bg,
@@ -108,7 +138,20 @@ class FunHouse(PortalBase):
             debug=debug,
         )
 
-        self.peripherals = Peripherals()
+        self.peripherals = Peripherals(
+            aht20_max_age=aht20_max_age,
+            dps310_max_age=dps310_max_age,
+            light_max_age=light_max_age,
+            calibrate_touch=calibrate_touch,
+            enable=enable,
+            disable=disable,
+        )
+        self._io_batch = None
+        self._io_batch_wakes = 0
+        self._io_batch_every = 1
+        self._io_batch_failures = 0
+        self.scheduler = Scheduler()
+        """The :py:class:`~adafruit_funhouse.scheduler.Scheduler` used by `run`"""
 
         gc.collect()
 
@@ -122,9 +165,152 @@ class FunHouse(PortalBase):
         :param float sleep_time: The amount of time to sleep in seconds
 
         """
-        if self._alarm:
+        restore_dotstars = self.peripherals.is_initialized("dotstars")
+        if self._alarm and restore_dotstars:
             dotstar_values = self.peripherals.dotstars
         super().enter_light_sleep(sleep_time)
-        for i, _ in enumerate(self.peripherals.dotstars):
-            self.peripherals.dotstars[i] = dotstar_values[i]
+        if restore_dotstars:
+            for i, _ in enumerate(self.peripherals.dotstars):
+                self.peripherals.dotstars[i] = dotstar_values[i]
+            if not self.peripherals.dotstars.auto_write:
+                self.peripherals.dotstars.show()
         gc.collect()
+
+    def init_io_batch(
+        self, upload_every: int = 10, *, capacity: int = 64, path: Optional[str] = None
+    ) -> StoreAndForward:
+        """Collect values with `add_to_io_batch` and upload them to Adafruit IO together
+        with `upload_io_batch`, so WiFi only has to connect every ``upload_every`` wakes.
+        The values are kept in memory, which survives light sleep.
+
+        :param int upload_every: How many calls to `upload_io_batch` it takes to upload.
+                                 Defaults to 10.
+        :param int capacity: The number of values to keep. The oldest value is dropped when
+                             the batch is full. Defaults to 64.
+        :param str path: A file to keep the values in instead, so they also survive deep
+                         sleep and reloads. Defaults to ``None``.
+        """
+        self._io_batch = StoreAndForward(path, capacity=capacity)
+        self._io_batch_every = upload_every
+        self._io_batch_wakes = 0
+        self._io_batch_failures = 0
+        return self._io_batch
+
+    def add_to_io_batch(
+        self, feed_key: str, data: Union[str, int, float], timestamp: Optional[int] = None
+    ) -> None:
+        """Add a value to the batch started with `init_io_batch`
+
+        :param str feed_key: Name of feed key to push data to.
+        :param data: The value to send.
+        :param int timestamp: The time of the value in seconds since the epoch. Defaults to
+                              `time.time()`.
+        """
+        if self._io_batch is None:
+            raise RuntimeError("Please initialize the IO batch before using")
+        from adafruit_io.adafruit_io import validate_feed_key
+
+        # A bad key would fail every upload, so reject it before it is stored
+        validate_feed_key(feed_key)
+        self._io_batch.append(feed_key, data, timestamp)
+
+    def upload_io_batch(self, force: bool = False) -> bool:
+        """Count a wake and upload the batch if this is the ``upload_every``'th wake or the
+        batch is full. WiFi is turned on for the upload and turned off again afterwards if it
+        was off, and only one connection attempt is made. Values that could not be uploaded
+        are kept for the next try, and the number of wakes until it doubles after each failed
+        upload, up to 8 times ``upload_every``. Return whether the batch was uploaded.
+
+        :param bool force: Upload now regardless of the number of wakes. Defaults to ``False``.
+        """
+        if self._io_batch is None:
+            raise RuntimeError("Please initialize the IO batch before using")
+        self._io_batch_wakes += 1
+        if not len(self._io_batch):
+            return False
+        if not (
+            force
+            or self._io_batch_wakes >= self._io_batch_every << self._io_batch_failures
+            or (not self._io_batch_failures and len(self._io_batch) >= self._io_batch.capacity)
+        ):
+            return False
+
+        from adafruit_io.adafruit_io_errors import AdafruitIO_RequestError, AdafruitIO_ThrottleError
+
+        feeds = {}
+        for feed_key, value, timestamp in self._io_batch.peek(len(self._io_batch)):
+            feeds.setdefault(feed_key, []).append((value, timestamp))
+        sent = []
+        was_enabled = self.network.enabled
+        try:
+            self.network.enabled = True
+            self.network.connect(max_attempts=1)
+            # One request per feed
+            for feed_key, samples in feeds.items():
+                self.network.push_batch_to_io(feed_key, samples)
+                sent.append(feed_key)
+        except (AdafruitIO_RequestError, AdafruitIO_ThrottleError, OSError, RuntimeError) as err:
+            print(f"Unable to upload the IO batch: {err!r}")
+        finally:
+            self.network.enabled = was_enabled
+            self._remove_from_io_batch(sent)
+        self._io_batch_wakes = 0
+        if len(sent) < len(feeds):
+            # Back off so an outage doesn't cost a connection attempt every wake
+            self._io_batch_failures = min(self._io_batch_failures + 1, 3)
+            return False
+        self._io_batch_failures = 0
+        return True
+
+    def _remove_from_io_batch(self, feed_keys: List[str]) -> None:
+        # Forget the feeds that were sent so a later try does not send them again
+        if not feed_keys:
+            return
+        records = self._io_batch.peek(len(self._io_batch))
+        self._io_batch.clear()
+        for feed_key, value, timestamp in records:
+            if feed_key not in feed_keys:
+                self._io_batch.append(feed_key, value, timestamp)
+
+    def every(self, interval: float, callback: Callable[[], None], *, priority: int = 0) -> Task:
+        """Run ``callback`` every ``interval`` seconds from `run`, starting at once
+
+        :param float interval: The time between runs, in seconds.
+        :param callback: The function to call, without arguments.
+        :param int priority: Tasks with a higher priority run first when several are due.
+                             Defaults to 0.
+        """
+        return self.scheduler.every(interval, callback, priority=priority)
+
+    def after(self, delay: float, callback: Callable[[], None], *, priority: int = 0) -> Task:
+        """Run ``callback`` once from `run`, ``delay`` seconds from now
+
+        :param float delay: The time until the run, in seconds.
+        :param callback: The function to call, without arguments.
+        :param int priority: Tasks with a higher priority run first when several are due.
+                             Defaults to 0.
+        """
+        return self.scheduler.after(delay, callback, priority=priority)
+
+    def run(self, *, light_sleep_threshold: Optional[float] = None) -> None:
+        """Run the tasks added with `every` and `after` until none are left. While no task is
+        due the board sleeps until the next one, instead of polling.
+
+        .. code-block:: python
+
+            funhouse.every(0.1, funhouse.network.mqtt_loop, priority=1)
+            funhouse.every(10, send_sensors)
+            funhouse.run()
+
+        :param float light_sleep_threshold: Use `enter_light_sleep` instead of `time.sleep`
+                                            for waits of at least this many seconds.
+                                            Defaults to ``None``, to never light sleep.
+        """
+
+        def sleep(wait: float) -> None:
+            if light_sleep_threshold is not None and wait >= light_sleep_threshold:
+                self.enter_light_sleep(wait)
+            else:
+                time.sleep(wait)
+
+        self.scheduler.run(sleep)
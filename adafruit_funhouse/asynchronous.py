@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_funhouse.asynchronous`
+================================================================================
+
+asyncio front end for the Adafruit FunHouse board.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit FunHouse <https://www.adafruit.com/product/4985>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+* Adafruit's asyncio library: https://github.com/adafruit/Adafruit_CircuitPython_asyncio
+
+"""
+
+import asyncio
+
+from adafruit_funhouse.inputs import BUTTON_NAMES, CAPTOUCH_NAMES
+
+try:
+    from typing import Any, Callable, Coroutine, Sequence, Tuple, Union
+
+    from adafruit_funhouse import FunHouse
+    from adafruit_funhouse.network import Network
+    from adafruit_funhouse.peripherals import EnvironmentReading, Peripherals
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FunHouse.git"
+
+
+class EventStream:
+    """An asynchronous iterator of ``(name, value)`` tuples, produced each time one of the
+    watched inputs changes value.
+
+    .. code-block:: python
+
+        async for name, pressed in funhouse.peripherals.button_events():
+            print(name, pressed)
+
+    :param inputs: A sequence of ``(name, read)`` pairs where ``read`` returns the input value.
+    :param float interval: How long to wait between scans of the inputs, in seconds.
+    """
+
+    def __init__(self, inputs: Sequence[Tuple[str, Callable[[], Any]]], interval: float) -> None:
+        self._inputs = inputs
+        self.interval = interval
+        self._last = [read() for _, read in inputs]
+        self._pending = []
+
+    def _scan(self) -> None:
+        for i, (name, read) in enumerate(self._inputs):
+            value = read()
+            if value != self._last[i]:
+                self._last[i] = value
+                self._pending.append((name, value))
+
+    def __aiter__(self) -> "EventStream":
+        return self
+
+    async def __anext__(self) -> Tuple[str, Any]:
+        while not self._pending:
+            await asyncio.sleep(self.interval)
+            self._scan()
+        return self._pending.pop(0)
+
+
+class AsyncPeripherals:
+    """Awaitable wrappers around a :py:class:`~adafruit_funhouse.peripherals.Peripherals`
+    instance. Sensor reads yield to other tasks while the sensors convert.
+
+    :param peripherals: The initialized Peripherals object to wrap.
+    :param float poll_interval: How long to yield between checks of a pending conversion,
+                                in seconds. Defaults to 0.01.
+    """
+
+    def __init__(self, peripherals: Peripherals, *, poll_interval: float = 0.01) -> None:
+        self.peripherals = peripherals
+        self.poll_interval = poll_interval
+        self._aht20_lock = asyncio.Lock()
+
+    async def read_aht20(self) -> Tuple[float, float]:
+        """Return a ``(temperature, relative_humidity)`` tuple from the AHT20, yielding
+        while the sensor converts. A fresh cached value is returned without a conversion.
+        """
+        cache = self.peripherals.aht20_cache
+        # Tasks that ask while a conversion is running wait for it instead of polling it too
+        async with self._aht20_lock:
+            if cache.fresh:
+                return cache.value
+            self.peripherals.start_aht20_measurement()
+            while True:
+                result = self.peripherals.poll_aht20()
+                if result is not None:
+                    return result
+                await asyncio.sleep(self.poll_interval)
+
+    async def temperature(self) -> float:
+        """Return the temperature in degrees Celsius"""
+        return (await self.read_aht20())[0]
+
+    async def relative_humidity(self) -> float:
+        """Return the relative humidity as a percentage (0 - 100)"""
+        return (await self.read_aht20())[1]
+
+    async def pressure(self) -> float:
+        """Return the barometric pressure in hPa, or equivalently in mBar"""
+        await asyncio.sleep(0)
+        return self.peripherals.pressure
+
+    async def read_environment(self) -> EnvironmentReading:
+        """Read the temperature, relative humidity and pressure like
+        :py:meth:`~adafruit_funhouse.peripherals.Peripherals.read_environment`, yielding
+        during the AHT20 conversion.
+        """
+        self.peripherals.aht20_cache.invalidate()
+        temperature, humidity = await self.read_aht20()
+        await asyncio.sleep(0)
+        return self.peripherals.record_environment(
+            temperature, humidity, self.peripherals.read_pressure()
+        )
+
+    async def tone_task(self, interval: float = 0.01) -> None:
+        """Advance the tones queued with
+        :py:meth:`~adafruit_funhouse.peripherals.Peripherals.queue_tone` forever
+
+        :param float interval: How long to wait between updates, in seconds. Defaults
+                               to 0.01.
+        """
+        while True:
+            self.peripherals.update_tones()
+            await asyncio.sleep(interval)
+
+    def button_events(self, interval: float = 0.02) -> EventStream:
+        """Return an `EventStream` of the Down, Sel and Up buttons
+
+        :param float interval: How long to wait between scans, in seconds. Defaults to 0.02.
+        """
+        read = self.peripherals.read_input
+        return EventStream(
+            [(name, lambda name=name: read(name)) for name in BUTTON_NAMES], interval
+        )
+
+    def touch_events(self, interval: float = 0.02) -> EventStream:
+        """Return an `EventStream` of the eight capacitive touch pads
+
+        :param float interval: How long to wait between scans, in seconds. Defaults to 0.02.
+        """
+        read = self.peripherals.read_input
+        return EventStream(
+            [(name, lambda name=name: read(name)) for name in CAPTOUCH_NAMES], interval
+        )
+
+
+class AsyncNetwork:
+    """Awaitable wrappers around a :py:class:`~adafruit_funhouse.network.Network` instance
+
+    :param network: The initialized Network object to wrap.
+    """
+
+    def __init__(self, network: Network) -> None:
+        self.network = network
+
+    async def mqtt_loop_task(self, *, interval: float = 0.05, timeout: float = 0.1) -> None:
+        """Run the MQTT loop forever, yielding to other tasks between iterations. Each
+        iteration blocks for ``timeout`` seconds, but never less than the MQTT socket
+        timeout, so initialize MQTT with a ``socket_timeout`` as short as ``timeout`` to
+        keep other tasks responsive.
+
+        :param float interval: How long to yield between loop iterations, in seconds.
+        :param float timeout: The timeout passed to ``mqtt_loop``, in seconds. Defaults to 0.1.
+        """
+        while True:
+            self.network.mqtt_loop(timeout=max(timeout, self.network.mqtt_socket_timeout))
+            await asyncio.sleep(interval)
+
+    async def mqtt_publish(
+        self,
+        *args: Union[str, int, float],
+        **kwargs: Union[str, int, float],
+    ) -> None:
+        """Publish to MQTT and yield to other tasks"""
+        self.network.mqtt_publish(*args, **kwargs)
+        await asyncio.sleep(0)
+
+
+class AsyncFunHouse:
+    """asyncio front end for a :py:class:`~adafruit_funhouse.FunHouse` instance
+
+    .. code-block:: python
+
+        import asyncio
+
+        from adafruit_funhouse import FunHouse
+        from adafruit_funhouse.asynchronous import AsyncFunHouse
+
+        funhouse = AsyncFunHouse(FunHouse(default_bg=None))
+
+        async def buttons():
+            async for name, pressed in funhouse.peripherals.button_events():
+                print(name, pressed)
+
+        async def sensors():
+            while True:
+                print(await funhouse.peripherals.temperature())
+                await asyncio.sleep(1)
+
+        funhouse.run(buttons(), sensors())
+
+    :param funhouse: The initialized FunHouse object to wrap.
+    """
+
+    def __init__(self, funhouse: FunHouse) -> None:
+        self.funhouse = funhouse
+        self.peripherals = AsyncPeripherals(funhouse.peripherals)
+        self.network = AsyncNetwork(funhouse.network) if funhouse.network else None
+
+    @staticmethod
+    def run(*coroutines: Coroutine) -> None:
+        """Run the coroutines as concurrent tasks until they all finish"""
+
+        async def main():
+            await asyncio.gather(*(asyncio.create_task(coroutine) for coroutine in coroutines))
+
+        asyncio.run(main())
@@ -0,0 +1,506 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_funhouse.inputs`
+================================================================================
+
+Input scanning helpers for the Adafruit FunHouse board.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit FunHouse <https://www.adafruit.com/product/4985>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+import time
+from collections import namedtuple
+
+from micropython import const
+
+try:
+    from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FunHouse.git"
+
+BUTTON_NAMES = ("button_down", "button_sel", "button_up")
+CAPTOUCH_NAMES = (
+    "captouch6",
+    "captouch7",
+    "captouch8",
+    "captouch13",
+    "captouch12",
+    "captouch11",
+    "captouch10",
+    "captouch9",
+)
+PIR_NAME = "pir_sensor"
+
+# Bits of Peripherals.input_state, in the same order as the InputScanner inputs
+BUTTON_DOWN_BIT = const(0x001)
+BUTTON_SEL_BIT = const(0x002)
+BUTTON_UP_BIT = const(0x004)
+CAPTOUCH6_BIT = const(0x008)
+CAPTOUCH7_BIT = const(0x010)
+CAPTOUCH8_BIT = const(0x020)
+CAPTOUCH13_BIT = const(0x040)
+CAPTOUCH12_BIT = const(0x080)
+CAPTOUCH11_BIT = const(0x100)
+CAPTOUCH10_BIT = const(0x200)
+CAPTOUCH9_BIT = const(0x400)
+PIR_BIT = const(0x800)
+BUTTONS_MASK = const(0x007)
+CAPTOUCH_MASK = const(0x7F8)
+SLIDER_MASK = const(0x7C0)
+
+# Slider pad masks, in position order, with CT13 as bit 0 and CT9 as bit 4
+_SLIDER_MAP = (0x01, 0x03, 0x02, 0x06, 0x04, 0x0C, 0x08, 0x18, 0x10)
+SLIDER_POSITIONS = tuple(
+    _SLIDER_MAP.index(mask) / 8 if mask in _SLIDER_MAP else None for mask in range(32)
+)
+"""Slider position for each of the 32 possible pad masks, or ``None`` for masks that are
+not a valid position."""
+
+TAP = const(1)
+SWIPE_UP = const(2)
+SWIPE_DOWN = const(3)
+
+PRESSED = const(1)
+RELEASED = const(2)
+LONG_PRESS = const(3)
+HELD = const(4)
+
+InputEvent = namedtuple("InputEvent", ("name", "event", "timestamp"))
+"""An input event. ``name`` is the input name such as ``"button_up"``, ``event`` is one of
+`PRESSED`, `RELEASED`, `LONG_PRESS` or `HELD` and ``timestamp`` is the `time.monotonic()`
+value of the scan that produced it."""
+
+
+def input_bit(name: str) -> int:
+    """Return the `Peripherals.input_state` bit of an input
+
+    :param str name: The input name, such as ``"button_up"``.
+    """
+    return 1 << (BUTTON_NAMES + CAPTOUCH_NAMES + (PIR_NAME,)).index(name)
+
+
+def is_set(mask: int, bits: int) -> bool:
+    """Return whether any of ``bits`` is set in ``mask``"""
+    return bool(mask & bits)
+
+
+def mask_changes(previous: int, current: int) -> Tuple[int, int]:
+    """Compare two input masks and return a ``(pressed, released)`` tuple of masks holding
+    the bits that turned on and the bits that turned off.
+
+    .. code-block:: python
+
+        from adafruit_funhouse import FunHouse
+        from adafruit_funhouse.inputs import BUTTON_UP_BIT, is_set, mask_changes
+
+        funhouse = FunHouse()
+
+        last = 0
+        while True:
+            state = funhouse.peripherals.input_state
+            if state != last:
+                pressed, released = mask_changes(last, state)
+                if is_set(pressed, BUTTON_UP_BIT):
+                    print("Up pressed")
+                last = state
+
+    """
+    changed = previous ^ current
+    return changed & current, changed & previous
+
+
+class InputScanner:
+    """Debounced, edge-triggered scanner for digital inputs. Every call to `scan` samples all
+    of the inputs once, updates a pressed/released/long-press/held state machine for each
+    and dispatches the resulting events to the registered callbacks and the event queue.
+
+    :param inputs: A sequence of ``(name, input)`` pairs where ``input`` has a boolean
+                   ``value`` attribute, such as a ``DigitalInOut`` or ``TouchIn``.
+    :param float debounce: How long a new value must stay stable before it is accepted,
+                           in seconds. Defaults to 0.02.
+    :param float long_press: How long an input must be pressed before `LONG_PRESS` is sent,
+                             in seconds. Defaults to 1.
+    :param float repeat: How often `HELD` is sent after a long press while the input stays
+                         pressed, in seconds. Defaults to ``None``, to not send `HELD`.
+    :param int max_events: The size of the event queue. The oldest events are dropped when
+                           it is full. Defaults to 16.
+    """
+
+    def __init__(
+        self,
+        inputs: Sequence[Tuple[str, Any]],
+        *,
+        debounce: float = 0.02,
+        long_press: float = 1,
+        repeat: Optional[float] = None,
+        max_events: int = 16,
+    ) -> None:
+        self.names = tuple(name for name, _ in inputs)
+        self._inputs = tuple(item for _, item in inputs)
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self.debounce = debounce
+        self.long_press = long_press
+        self.repeat = repeat
+        self.max_events = max_events
+        count = len(self._inputs)
+        self._raw = [False] * count
+        self._state = [False] * count
+        self._changed_at = [0.0] * count
+        self._next_hold = [None] * count
+        self._long_sent = [False] * count
+        self._callbacks = {}
+        self._events = []
+
+    def on(self, name: Optional[str], event: int, callback: Callable[[InputEvent], None]) -> None:
+        """Register a callback for an event on an input
+
+        :param str name: The input name, or ``None`` to receive the event from every input.
+                         The callback of the input itself is called first.
+        :param int event: One of `PRESSED`, `RELEASED`, `LONG_PRESS` or `HELD`.
+        :param callback: The function to call with the `InputEvent`, or ``None`` to remove it.
+        """
+        if name is not None and name not in self._index:
+            raise ValueError(f"Unknown input {name}")
+        if callback is None:
+            self._callbacks.pop((name, event), None)
+        else:
+            self._callbacks[(name, event)] = callback
+
+    def _dispatch(self, name: str, event: int, now: float) -> None:
+        input_event = InputEvent(name, event, now)
+        callbacks = self._callbacks
+        callback = callbacks.get((name, event))
+        if callback is not None:
+            callback(input_event)
+        # Callbacks for every input also get the events of inputs with their own callback
+        callback = callbacks.get((None, event))
+        if callback is not None:
+            callback(input_event)
+        if self.max_events:
+            if len(self._events) >= self.max_events:
+                self._events.pop(0)
+            self._events.append(input_event)
+
+    def scan(self, now: Optional[float] = None) -> None:
+        """Sample every input once and dispatch any resulting events
+
+        :param float now: The `time.monotonic()` value to use. Defaults to reading the clock.
+        """
+        if now is None:
+            now = time.monotonic()
+        raw = self._raw
+        state = self._state
+        changed_at = self._changed_at
+        for i, item in enumerate(self._inputs):
+            value = item.value
+            if value != raw[i]:
+                raw[i] = value
+                changed_at[i] = now
+            if value != state[i]:
+                if now - changed_at[i] >= self.debounce:
+                    state[i] = value
+                    if value:
+                        self._next_hold[i] = now + self.long_press
+                        self._long_sent[i] = False
+                        self._dispatch(self.names[i], PRESSED, now)
+                    else:
+                        self._next_hold[i] = None
+                        self._dispatch(self.names[i], RELEASED, now)
+            elif value and self._next_hold[i] is not None and now >= self._next_hold[i]:
+                if self._long_sent[i]:
+                    self._dispatch(self.names[i], HELD, now)
+                else:
+                    self._long_sent[i] = True
+                    self._dispatch(self.names[i], LONG_PRESS, now)
+                self._next_hold[i] = None if self.repeat is None else now + self.repeat
+
+    def get_event(self) -> Optional[InputEvent]:
+        """Return the oldest queued `InputEvent` or ``None`` if the queue is empty"""
+        if self._events:
+            return self._events.pop(0)
+        return None
+
+    def events(self) -> List[InputEvent]:
+        """Return and clear all of the queued events, oldest first"""
+        events = self._events
+        self._events = []
+        return events
+
+    def pressed(self, name: str) -> bool:
+        """Return the debounced state of an input
+
+        :param str name: The input name, such as ``"button_up"``.
+        """
+        return self._state[self._index[name]]
+
+    def pressed_duration(self, name: str, now: Optional[float] = None) -> float:
+        """Return how long an input has been pressed, in seconds, or 0 if it is released
+
+        :param str name: The input name, such as ``"button_up"``.
+        :param float now: The `time.monotonic()` value to use. Defaults to reading the clock.
+        """
+        i = self._index[name]
+        if not self._state[i]:
+            return 0
+        if now is None:
+            now = time.monotonic()
+        return now - self._changed_at[i]
+
+    @property
+    def state(self) -> Dict[str, bool]:
+        """
+        Return the debounced state of every input
+        """
+        return dict(zip(self.names, self._state))
+
+
+class SliderDecoder:
+    """Decoder for the five pad capacitive slider. Call `update` at the scan rate to track the
+    position, the velocity and the tap and swipe gestures.
+
+    .. code-block:: python
+
+        from adafruit_funhouse import FunHouse
+        from adafruit_funhouse.inputs import SWIPE_UP
+
+        funhouse = FunHouse()
+        slider = funhouse.peripherals.slider_decoder
+        slider.interpolate = True
+
+        while True:
+            position = slider.update()
+            if position is not None:
+                funhouse.peripherals.dotstars.brightness = position
+            if slider.get_gesture() == SWIPE_UP:
+                print("Swiped up")
+
+    :param pads: The five ``TouchIn`` pads of the slider, in position order.
+    :param bool interpolate: Use the raw touch counts to compute a continuous position
+                             instead of one of 9 steps. Defaults to ``False``.
+    :param float tap_time: The longest touch that counts as a tap, in seconds. Defaults to 0.3.
+    :param float swipe_distance: The shortest travel that counts as a swipe, as a fraction of
+                                 the slider length. Defaults to 0.5.
+    :param float smoothing: The weight of each new sample in the velocity average, between 0
+                            and 1. Defaults to 0.5.
+    """
+
+    def __init__(
+        self,
+        pads: Sequence[Any],
+        *,
+        interpolate: bool = False,
+        tap_time: float = 0.3,
+        swipe_distance: float = 0.5,
+        smoothing: float = 0.5,
+    ) -> None:
+        self._pads = tuple(pads)
+        self.interpolate = interpolate
+        self.tap_time = tap_time
+        self.swipe_distance = swipe_distance
+        self.smoothing = smoothing
+        self._position = None
+        self._timestamp = None
+        self._start_position = None
+        self._start_time = None
+        self._velocity = 0.0
+        self._gesture = None
+
+    def read_mask(self) -> int:
+        """Return the touched pads as a 5 bit mask"""
+        mask = 0
+        bit = 1
+        for pad in self._pads:
+            if pad.value:
+                mask |= bit
+            bit <<= 1
+        return mask
+
+    def _read_interpolated(self) -> Optional[float]:
+        total = 0
+        weighted = 0
+        for i, pad in enumerate(self._pads):
+            strength = pad.raw_value - pad.threshold
+            if strength > 0:
+                total += strength
+                weighted += strength * i
+        if not total:
+            return None
+        return weighted / total / (len(self._pads) - 1)
+
+    def read(self) -> Optional[float]:
+        """Return the slider position in the range of 0.0-1.0 or ``None`` if not touched,
+        without updating the velocity or the gestures
+        """
+        if self.interpolate:
+            return self._read_interpolated()
+        return SLIDER_POSITIONS[self.read_mask()]
+
+    def update(self, now: Optional[float] = None) -> Optional[float]:
+        """Read the slider, update the velocity and the gestures and return the position
+
+        :param float now: The `time.monotonic()` value to use. Defaults to reading the clock.
+        """
+        if now is None:
+            now = time.monotonic()
+        position = self.read()
+        previous = self._position
+        if position is None:
+            if previous is not None:
+                self._end_touch(previous, now)
+            self._velocity = 0.0
+        elif previous is None:
+            self._start_position = position
+            self._start_time = now
+        elif now > self._timestamp:
+            sample = (position - previous) / (now - self._timestamp)
+            self._velocity += self.smoothing * (sample - self._velocity)
+        self._position = position
+        self._timestamp = now
+        return position
+
+    def _end_touch(self, last_position: float, now: float) -> None:
+        distance = last_position - self._start_position
+        if distance >= self.swipe_distance:
+            self._gesture = SWIPE_UP
+        elif distance <= -self.swipe_distance:
+            self._gesture = SWIPE_DOWN
+        elif now - self._start_time <= self.tap_time:
+            self._gesture = TAP
+
+    def get_gesture(self) -> Optional[int]:
+        """Return and clear the last completed gesture, one of `TAP`, `SWIPE_UP` or
+        `SWIPE_DOWN`, or ``None`` if there is none
+        """
+        gesture = self._gesture
+        self._gesture = None
+        return gesture
+
+    @property
+    def position(self) -> Optional[float]:
+        """
+        Return the position from the last `update` or ``None`` if not touched
+        """
+        return self._position
+
+    @property
+    def velocity(self) -> float:
+        """
+        Return the smoothed slider velocity in slider lengths per second
+        """
+        return self._velocity
+
+
+class TouchCalibration:
+    """Per-pad baseline calibration for capacitive touch pads. `calibrate` measures the
+    untouched raw count of each pad and `update` follows slow drift, for example from humidity
+    changes, with an exponential moving average. The threshold of each pad is kept at its
+    baseline plus a margin.
+
+    :param pads: The ``TouchIn`` pads to calibrate.
+    :param float sensitivity: The touch margin as a fraction of the baseline. Defaults to 0.1.
+    :param int min_margin: The smallest touch margin, in raw counts. Defaults to 200.
+    :param float drift_rate: The weight of each untouched sample in the baseline average,
+                             between 0 and 1. Defaults to 0.01.
+    """
+
+    def __init__(
+        self,
+        pads: Sequence[Any],
+        *,
+        sensitivity: float = 0.1,
+        min_margin: int = 200,
+        drift_rate: float = 0.01,
+    ) -> None:
+        self._pads = tuple(pads)
+        self.sensitivity = sensitivity
+        self.min_margin = min_margin
+        self.drift_rate = drift_rate
+        self._baselines = None
+        self._raw_values = [0] * len(self._pads)
+
+    def calibrate(self, samples: int = 16, interval: float = 0.005) -> None:
+        """Measure the baseline of every pad and set the thresholds. The pads must not be
+        touched while this runs.
+
+        :param int samples: The number of samples to average. Defaults to 16.
+        :param float interval: The delay between samples, in seconds. Defaults to 0.005.
+        """
+        totals = [0] * len(self._pads)
+        for _ in range(samples):
+            for i, pad in enumerate(self._pads):
+                totals[i] += pad.raw_value
+            time.sleep(interval)
+        self._baselines = [total / samples for total in totals]
+        for i in range(len(self._pads)):
+            self._apply_threshold(i)
+
+    def _apply_threshold(self, index: int) -> None:
+        baseline = self._baselines[index]
+        margin = max(self.min_margin, baseline * self.sensitivity)
+        self._pads[index].threshold = int(baseline + margin)
+
+    def update(self) -> None:
+        """Sample the raw counts and move the baseline of each untouched pad towards them"""
+        if self._baselines is None:
+            raise RuntimeError("Please calibrate before updating")
+        raw_values = self._raw_values
+        baselines = self._baselines
+        for i, pad in enumerate(self._pads):
+            raw = pad.raw_value
+            raw_values[i] = raw
+            if raw < pad.threshold:
+                baseline = baselines[i] + self.drift_rate * (raw - baselines[i])
+                if int(baseline) != int(baselines[i]):
+                    baselines[i] = baseline
+                    self._apply_threshold(i)
+                else:
+                    baselines[i] = baseline
+
+    @property
+    def calibrated(self) -> bool:
+        """
+        Return whether `calibrate` has been run
+        """
+        return self._baselines is not None
+
+    @property
+    def baselines(self) -> Optional[Tuple[float, ...]]:
+        """
+        Return the baseline raw count of every pad or ``None`` before calibration
+        """
+        if self._baselines is None:
+            return None
+        return tuple(self._baselines)
+
+    @property
+    def thresholds(self) -> Tuple[int, ...]:
+        """
+        Return the current threshold of every pad
+        """
+        return tuple(pad.threshold for pad in self._pads)
+
+    @property
+    def raw_values(self) -> Tuple[int, ...]:
+        """
+        Return the raw counts sampled by the last `update`
+        """
+        return tuple(self._raw_values)
@@ -0,0 +1,256 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_funhouse.jsonpath`
+================================================================================
+
+Streaming JSON path extraction for the Adafruit FunHouse board.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit FunHouse <https://www.adafruit.com/product/4985>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+import json
+
+try:
+    from typing import Any, List, Sequence, Union
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FunHouse.git"
+
+# What the scanner expects next
+_VALUE = 0
+_KEY = 1
+_COLON = 2
+_NEXT = 3
+
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_COMMA = ord(",")
+_COLON_CHAR = ord(":")
+_OPEN_OBJECT = ord("{")
+_CLOSE_OBJECT = ord("}")
+_OPEN_ARRAY = ord("[")
+_CLOSE_ARRAY = ord("]")
+_WHITESPACE = b" \t\r\n"
+_SCALAR_END = b" \t\r\n,}]"
+_MISSING = object()
+
+
+class JsonPathExtractor:
+    """Picks the values at a set of JSON paths out of a JSON document that is fed in
+    chunks, without building the rest of the document. Only the selected values are kept,
+    so memory use depends on their size rather than on the size of the document.
+
+    The paths use the same form as the ``json_path`` of
+    :py:class:`~adafruit_funhouse.FunHouse`: a list of keys and list indexes, or a list of
+    such lists. Negative indexes can't be resolved before the end of a list, so they are
+    not supported.
+
+    :param json_path: The path or list of paths to extract.
+    """
+
+    def __init__(self, json_path: Union[Sequence[Any], Sequence[Sequence[Any]]]) -> None:
+        if not json_path or not isinstance(json_path[0], (list, tuple)):
+            json_path = (json_path,)
+        self._paths = [tuple(path) for path in json_path]
+        self._targets = set(self._paths)
+        self._prefixes = set()
+        for path in self._paths:
+            for index in range(len(path)):
+                self._prefixes.add(path[:index])
+        self._found = {}
+        # One [is_object, key_or_index, relevant] entry per open container
+        self._stack = []
+        self._state = _VALUE
+        self._in_string = False
+        self._escape = False
+        self._in_scalar = False
+        self._key = None
+        self._capture = None
+        self._capture_start = 0
+        self._capture_depth = 0
+        self._capture_path = None
+        self._done = False
+
+    @property
+    def paths(self) -> List[tuple]:
+        """
+        Return the paths to extract as tuples
+        """
+        return self._paths
+
+    @property
+    def done(self) -> bool:
+        """
+        Return whether every path has been found or the document has ended
+        """
+        return self._done
+
+    def feed(self, chunk: bytes) -> bool:
+        """Scan the next chunk of the document. Return `done`.
+
+        :param bytes chunk: The next bytes of the document.
+        """
+        if self._done:
+            return True
+        self._capture_start = 0
+        index = 0
+        length = len(chunk)
+        while index < length and not self._done:
+            if self._in_string:
+                index = self._scan_string(chunk, index)
+                continue
+            char = chunk[index]
+            if self._in_scalar:
+                if char not in _SCALAR_END:
+                    index += 1
+                    continue
+                self._in_scalar = False
+                self._value_end(chunk, index)
+            if char not in _WHITESPACE:
+                self._scan_token(chunk, index, char)
+            index += 1
+        if self._capture is not None:
+            # The value continues in the next chunk
+            self._capture.append(bytes(chunk[self._capture_start :]))
+        return self._done
+
+    def _scan_token(self, chunk: bytes, index: int, char: int) -> None:
+        state = self._state
+        if state == _VALUE:
+            if char == _CLOSE_ARRAY and self._stack and not self._stack[-1][0]:
+                # An empty list
+                self._close(chunk, index)
+            else:
+                self._value_start(index, char)
+        elif state == _KEY:
+            if char == _QUOTE:
+                self._in_string = True
+                self._key = [] if self._stack[-1][2] else None
+            elif char == _CLOSE_OBJECT:
+                self._close(chunk, index)
+            else:
+                raise ValueError("Expected a key in the JSON data")
+        elif state == _COLON:
+            if char != _COLON_CHAR:
+                raise ValueError("Expected ':' in the JSON data")
+            self._state = _VALUE
+        elif char == _COMMA and self._stack:
+            top = self._stack[-1]
+            if top[0]:
+                self._state = _KEY
+            else:
+                top[1] += 1
+                self._state = _VALUE
+        elif char in {_CLOSE_OBJECT, _CLOSE_ARRAY} and self._stack:
+            self._close(chunk, index)
+        else:
+            raise ValueError("Unexpected character in the JSON data")
+
+    def _scan_string(self, chunk: bytes, index: int) -> int:
+        end = index
+        length = len(chunk)
+        while end < length:
+            char = chunk[end]
+            if self._escape:
+                self._escape = False
+            elif char == _BACKSLASH:
+                self._escape = True
+            elif char == _QUOTE:
+                break
+            end += 1
+        if self._key is not None:
+            self._key.append(bytes(chunk[index:end]))
+        if end == length:
+            return end
+        self._in_string = False
+        if self._state == _KEY:
+            top = self._stack[-1]
+            if self._key is not None:
+                top[1] = json.loads(b'"' + b"".join(self._key) + b'"')
+                self._key = None
+            else:
+                top[1] = None
+            self._state = _COLON
+        else:
+            self._value_end(chunk, end + 1)
+        return end + 1
+
+    def _value_start(self, index: int, char: int) -> None:
+        if self._capture is None and (not self._stack or self._stack[-1][2]):
+            path = tuple(entry[1] for entry in self._stack)
+            if path in self._targets:
+                self._capture = []
+                self._capture_depth = len(self._stack)
+                self._capture_path = path
+                self._capture_start = index
+        if char == _OPEN_OBJECT:
+            self._push(True, None)
+            self._state = _KEY
+        elif char == _OPEN_ARRAY:
+            self._push(False, 0)
+            self._state = _VALUE
+        elif char == _QUOTE:
+            self._in_string = True
+        else:
+            self._in_scalar = True
+
+    def _push(self, is_object: bool, key: Any) -> None:
+        # Keys only need decoding inside containers on the way to a path
+        relevant = not self._stack or (
+            self._stack[-1][2] and tuple(entry[1] for entry in self._stack) in self._prefixes
+        )
+        self._stack.append([is_object, key, relevant])
+
+    def _close(self, chunk: bytes, index: int) -> None:
+        self._stack.pop()
+        self._value_end(chunk, index + 1)
+
+    def _value_end(self, chunk: bytes, end: int) -> None:
+        self._state = _NEXT
+        if self._capture is not None and len(self._stack) == self._capture_depth:
+            self._capture.append(bytes(chunk[self._capture_start : end]))
+            value = json.loads(b"".join(self._capture))
+            self._capture = None
+            depth = len(self._capture_path)
+            for path in self._targets:
+                if path[:depth] == self._capture_path and path not in self._found:
+                    # Paths inside the captured value are picked out of it
+                    self._found[path] = self._traverse(value, path[depth:])
+            if len(self._found) == len(self._targets):
+                self._done = True
+        if not self._stack:
+            self._done = True
+
+    @staticmethod
+    def _traverse(value: Any, path: tuple) -> Any:
+        for key in path:
+            try:
+                value = value[key]
+            except (TypeError, KeyError, IndexError):
+                return _MISSING
+        return value
+
+    def values(self) -> List[Any]:
+        """Return the extracted values in the order of the paths"""
+        values = [self._found.get(path, _MISSING) for path in self._paths]
+        if _MISSING in values:
+            raise ValueError("The specified json_path was not found in the results.")
+        return values
@@ -0,0 +1,350 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_funhouse.lights`
+================================================================================
+
+DotStar frame buffer and animations for the Adafruit FunHouse board.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit FunHouse <https://www.adafruit.com/product/4985>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+* Adafruit's DotStar library: https://github.com/adafruit/Adafruit_CircuitPython_DotStar
+
+"""
+
+import time
+
+try:
+    from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+    import adafruit_dotstar
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FunHouse.git"
+
+
+def _rgb(color: Union[int, Sequence[int]]) -> Tuple[int, int, int]:
+    if isinstance(color, int):
+        return (color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF
+    return color[0], color[1], color[2]
+
+
+class FrameBuffer:
+    """Collects pixel writes in a preallocated buffer and sends them to the DotStars in a
+    single transfer with `show`.
+
+    Brightness and gamma correction are applied by `show` through a 256 entry lookup
+    table, which is only rebuilt when `brightness` or `gamma` change. The brightness of the
+    DotStars is taken over and set to 1.0 so the driver does not scale the pixels again.
+
+    Creating a FrameBuffer also turns off ``auto_write`` on the DotStars, and `show`
+    overwrites every pixel, so don't write to the DotStars directly afterwards. Use a
+    `BufferedPixels` instead, which is what
+    :py:attr:`~adafruit_funhouse.peripherals.Peripherals.dotstars` returns once the frame
+    buffer exists.
+
+    :param pixels: The DotStars to draw to.
+    :param float gamma: The gamma correction exponent. Defaults to 1.0, for no correction.
+    """
+
+    def __init__(self, pixels: adafruit_dotstar.DotStar, *, gamma: float = 1.0) -> None:
+        self._pixels = pixels
+        pixels.auto_write = False
+        self._brightness = pixels.brightness
+        pixels.brightness = 1.0
+        self._gamma = gamma
+        self._table = None
+        self._count = len(pixels)
+        self.buffer = bytearray(3 * self._count)
+        """The ``R, G, B`` bytes of each pixel"""
+        self._dirty = True
+
+    @property
+    def brightness(self) -> float:
+        """
+        Get or Set the brightness from 0.0 to 1.0, applied on the next `show`
+        """
+        return self._brightness
+
+    @brightness.setter
+    def brightness(self, value: float) -> None:
+        value = min(1.0, max(0.0, value))
+        if value != self._brightness:
+            self._brightness = value
+            self._table = None
+            self._dirty = True
+
+    @property
+    def gamma(self) -> float:
+        """
+        Get or Set the gamma correction exponent, applied on the next `show`
+        """
+        return self._gamma
+
+    @gamma.setter
+    def gamma(self, value: float) -> None:
+        if value != self._gamma:
+            self._gamma = value
+            self._table = None
+            self._dirty = True
+
+    def _lookup_table(self) -> bytearray:
+        if self._table is None:
+            scale = 255 * self._brightness
+            gamma = self._gamma
+            self._table = bytearray(round(scale * (level / 255) ** gamma) for level in range(256))
+        return self._table
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Tuple[int, int, int]:
+        offset = 3 * index
+        return tuple(self.buffer[offset : offset + 3])
+
+    def __setitem__(self, index: int, color: Union[int, Sequence[int]]) -> None:
+        offset = 3 * index
+        self.buffer[offset : offset + 3] = bytes(_rgb(color))
+        self._dirty = True
+
+    def fill(self, color: Union[int, Sequence[int]]) -> None:
+        """Set every pixel to ``color``
+
+        :param color: A ``0xRRGGBB`` int or an ``(r, g, b)`` tuple.
+        """
+        self.buffer[:] = bytes(_rgb(color)) * self._count
+        self._dirty = True
+
+    def load(self, frame: Union[bytes, bytearray]) -> None:
+        """Replace the whole buffer with a frame of ``R, G, B`` bytes
+
+        :param bytes frame: ``3 * len(self)`` bytes, such as a frame of an `Animation`.
+        """
+        self.buffer[:] = frame
+        self._dirty = True
+
+    def show(self) -> None:
+        """Send the buffer to the DotStars if it changed since the last `show`"""
+        if not self._dirty:
+            return
+        buffer = self.buffer
+        table = self._lookup_table()
+        pixels = self._pixels
+        for index in range(self._count):
+            offset = 3 * index
+            pixels[index] = (
+                table[buffer[offset]],
+                table[buffer[offset + 1]],
+                table[buffer[offset + 2]],
+            )
+        pixels.show()
+        self._dirty = False
+
+
+class BufferedPixels:
+    """Takes the place of the DotStars once a `FrameBuffer` draws to them, so code written
+    for the DotStars keeps working. Writes go to the frame buffer and, with ``auto_write``,
+    are shown right away, and `brightness` is the brightness of the frame buffer so it is
+    only applied once.
+
+    :param frame_buffer: The frame buffer to write to.
+    :param bool auto_write: Whether each write is shown right away. Defaults to ``True``.
+    """
+
+    def __init__(self, frame_buffer: FrameBuffer, *, auto_write: bool = True) -> None:
+        self.frame_buffer = frame_buffer
+        self.auto_write = auto_write
+
+    @property
+    def brightness(self) -> float:
+        """
+        Get or Set the brightness from 0.0 to 1.0
+        """
+        return self.frame_buffer.brightness
+
+    @brightness.setter
+    def brightness(self, value: float) -> None:
+        self.frame_buffer.brightness = value
+        if self.auto_write:
+            self.frame_buffer.show()
+
+    def __len__(self) -> int:
+        return len(self.frame_buffer)
+
+    def _index(self, index: int) -> int:
+        count = len(self.frame_buffer)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("Pixel index out of range")
+        return index
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Tuple[int, int, int], List[Tuple[int, int, int]]]:
+        if isinstance(index, slice):
+            return [self.frame_buffer[i] for i in range(*index.indices(len(self)))]
+        return self.frame_buffer[self._index(index)]
+
+    def __setitem__(
+        self, index: Union[int, slice], color: Union[int, Sequence[int], Sequence]
+    ) -> None:
+        if isinstance(index, slice):
+            for i, value in zip(range(*index.indices(len(self))), color):
+                self.frame_buffer[i] = value
+        else:
+            self.frame_buffer[self._index(index)] = color
+        if self.auto_write:
+            self.frame_buffer.show()
+
+    def fill(self, color: Union[int, Sequence[int]]) -> None:
+        """Set every pixel to ``color``
+
+        :param color: A ``0xRRGGBB`` int or an ``(r, g, b)`` tuple.
+        """
+        self.frame_buffer.fill(color)
+        if self.auto_write:
+            self.frame_buffer.show()
+
+    def show(self) -> None:
+        """Send the pixels to the DotStars if they changed"""
+        self.frame_buffer.show()
+
+
+class Animation:
+    """A sequence of keyframes turned into precomputed frames at a fixed frame rate. The
+    colors between two keyframes are blended, so playing it only copies frames.
+
+    .. code-block:: python
+
+        pulse = Animation([(0, [0x000000] * 5), (1, [0xFF0000] * 5), (2, [0x000000] * 5)])
+        funhouse.peripherals.play_animation(pulse)
+        while True:
+            funhouse.peripherals.update_animation()
+
+    :param keyframes: A sequence of ``(time, colors)`` tuples, in order of time, where
+                      ``time`` is in seconds from the start and ``colors`` holds one
+                      ``0xRRGGBB`` int or ``(r, g, b)`` tuple per pixel.
+    :param int fps: The number of frames per second. Defaults to 30.
+    :param bool loop: Whether to start again after the last keyframe. Defaults to ``True``.
+    :param easing: A function that maps the progress between two keyframes, from 0 to 1,
+                   to the blend of their colors. Defaults to ``None``, for a linear blend.
+    """
+
+    def __init__(
+        self,
+        keyframes: Sequence[Tuple[float, Sequence[Union[int, Sequence[int]]]]],
+        *,
+        fps: int = 30,
+        loop: bool = True,
+        easing: Optional[Callable[[float], float]] = None,
+    ) -> None:
+        if not keyframes:
+            raise ValueError("An animation needs at least one keyframe")
+        self.fps = fps
+        self.loop = loop
+        self.duration = keyframes[-1][0]
+        keys = [(when, [_rgb(color) for color in colors]) for when, colors in keyframes]
+        count = int(self.duration * fps)
+        if not loop or count == 0:
+            # Include the last keyframe itself
+            count += 1
+        self.frames = []
+        """The precomputed frames of ``R, G, B`` bytes"""
+        key = 0
+        for number in range(count):
+            now = number / fps
+            while key < len(keys) - 2 and now >= keys[key + 1][0]:
+                key += 1
+            self.frames.append(self._blend(keys, key, now, easing))
+
+    @staticmethod
+    def _blend(keys: list, key: int, now: float, easing: Optional[Callable]) -> bytes:
+        start_time, start = keys[key]
+        if key + 1 >= len(keys):
+            return bytes(channel for color in start for channel in color)
+        end_time, end = keys[key + 1]
+        span = end_time - start_time
+        progress = min(1, max(0, (now - start_time) / span)) if span > 0 else 1
+        if easing is not None:
+            progress = easing(progress)
+        return bytes(
+            min(255, max(0, round(a + (b - a) * progress)))
+            for first, second in zip(start, end)
+            for a, b in zip(first, second)
+        )
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+
+class AnimationPlayer:
+    """Plays an `Animation` on a `FrameBuffer`, sending at most one frame per `update`
+
+    :param frame_buffer: The frame buffer to draw to.
+    """
+
+    def __init__(self, frame_buffer: FrameBuffer) -> None:
+        self.frame_buffer = frame_buffer
+        self._animation = None
+        self._start = 0
+        self._last_frame = None
+
+    def play(self, animation: Animation) -> None:
+        """Start playing ``animation`` from its first frame
+
+        :param animation: The animation to play.
+        """
+        self._animation = animation
+        self._start = time.monotonic()
+        self._last_frame = None
+
+    def stop(self) -> None:
+        """Stop playing, leaving the current frame on the DotStars"""
+        self._animation = None
+
+    @property
+    def playing(self) -> bool:
+        """
+        Return whether an animation is playing
+        """
+        return self._animation is not None
+
+    def update(self, now: Optional[float] = None) -> bool:
+        """Show the frame that is due, if it is not already showing. Return `playing`.
+
+        :param float now: The `time.monotonic()` value to use. Defaults to reading the clock.
+        """
+        animation = self._animation
+        if animation is None:
+            return False
+        if now is None:
+            now = time.monotonic()
+        frame = int((now - self._start) * animation.fps)
+        if frame >= len(animation):
+            if animation.loop:
+                frame %= len(animation)
+            else:
+                frame = len(animation) - 1
+                self._animation = None
+        if frame != self._last_frame:
+            self._last_frame = frame
+            self.frame_buffer.load(animation.frames[frame])
+            self.frame_buffer.show()
+        return self._animation is not None
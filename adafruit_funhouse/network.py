@@ -27,17 +27,37 @@ Implementation Notes
 
 """
 
+import gc
+import json
+import random
 import ssl
+import time
 
 import adafruit_minimqtt.adafruit_minimqtt as MQTT
+import adafruit_requests
+import socketpool
+import wifi
 from adafruit_io.adafruit_io import IO_MQTT
-from adafruit_portalbase.network import NetworkBase
+from adafruit_io.adafruit_io_errors import AdafruitIO_RequestError, AdafruitIO_ThrottleError
+from adafruit_minimqtt.adafruit_minimqtt import MMQTTException
+from adafruit_portalbase.network import CONTENT_JSON, NetworkBase
 from adafruit_portalbase.wifi_esp32s2 import WiFi
 
+from adafruit_funhouse.jsonpath import JsonPathExtractor
+from adafruit_funhouse.routing import TopicRouter
+from adafruit_funhouse.telemetry import (
+    DutyCycle,
+    FrameCodec,
+    PublishQueue,
+    ReportingPolicy,
+    StoreAndForward,
+)
+
 try:
-    from typing import Callable, Optional, Union
+    from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
     from adafruit_dotstar import DotStar
+    from adafruit_requests import Response, Session
 except ImportError:
     pass
 
@@ -46,10 +66,72 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FunHouse.git"
 
 IO_MQTT_BROKER = "io.adafruit.com"
 
+# 2024-01-01, a time before it means the clock had not been set
+_CLOCK_SET = 1704067200
+
+
+class SharedWiFi(WiFi):
+    """The PortalBase WiFi helper, except that `connect` attaches a socket pool and requests
+    session that are kept across reconnects instead of creating new ones every time.
+
+    :param resources: The function that returns the ``(pool, session)`` to attach.
+    :param status_led: The initialized object for status DotStar. Defaults to ``None``,
+                       to not use the status LED
+    """
+
+    def __init__(
+        self, resources: Callable[[], Tuple[socketpool.SocketPool, Session]], *, status_led=None
+    ) -> None:
+        super().__init__(status_led=status_led)
+        self._resources = resources
+        self._attached = False
+
+    def connect(self, ssid: str, password: str) -> None:
+        """Connect to the WiFi network and attach the shared pool and session
+
+        :param str ssid: The WiFi name
+        :param str password: The WiFi password
+        """
+        wifi.radio.connect(ssid, password)
+        self.pool, self.requests = self._resources()
+        self._attached = True
+
+    def reset(self) -> None:
+        """Detach the pool and session, so the next `connect` attaches them again"""
+        self.pool = None
+        self.requests = None
+        self._attached = False
+
+    @property
+    def is_connected(self) -> bool:
+        """
+        Return whether the shared pool and session are attached to a connection
+        """
+        return self._attached
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Get or Set whether the WiFi radio is enabled
+        """
+        return wifi.radio.enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        WiFi.enabled.fset(self, value)
+        if not wifi.radio.enabled:
+            self._attached = False
+
 
 class Network(NetworkBase):
     """Class representing the Adafruit FunHouse.
 
+    Creating a Network loads the WiFi, SSL, requests and MQTT modules, because the
+    PortalBase network and WiFi classes it builds on import them. Only
+    ``FunHouse(network=False)``, which never creates a Network, avoids those imports. One
+    socket pool and SSL context are shared by MQTT and HTTP requests and kept across
+    reconnects, see `resource_stats`.
+
     :param status_dotstar: The initialized object for status DotStar. Defaults to ``None``,
                            to not use the status LED
     :param bool extract_values: If true, single-length fetched values are automatically extracted
@@ -65,15 +147,221 @@ class Network(NetworkBase):
         extract_values: bool = True,
         debug: bool = False,
     ) -> None:
+        # Reuse one socket pool, SSL context and requests session across WiFi reconnects
         super().__init__(
-            WiFi(status_led=status_dotstar),
+            SharedWiFi(self._shared_resources, status_led=status_dotstar),
             extract_values=extract_values,
             debug=debug,
         )
+        self._ssl_context = None
+        self._socket_pool = None
+        self._session = None
+        self._resource_builds = {"ssl_context": 0, "socket_pool": 0, "session": 0}
         self._mqtt_client = None
+        self._mqtt_base_client = None
+        self._mqtt_username = None
+        self._mqtt_socket_timeout = 1
+        self._publish_queue = None
+        self._store = None
+        self._replay_batch_size = 16
+        self._next_replay = None
+        self._replay_attempt = 0
+        self._policies = {}
+        self._router = TopicRouter()
+        self._duty_cycle = None
+        self._frame_codec = None
+        self._json_chunk_size = None
+        self._response_cache = None
+        self._response_cache_size = 4
+        self.response_cache_hits = 0
+        """The number of fetches answered from the response cache"""
+        self.response_cache_misses = 0
+        """The number of fetches that downloaded and parsed the response"""
+        self._mqtt_topics = []
+        self._auto_reconnect = False
+        self._reconnect_initial_delay = 1
+        self._reconnect_max_delay = 60
+        self._reconnect_attempt = 0
+        self._next_reconnect = None
+        self.mqtt_reconnects = 0
+        """The number of times MQTT was reconnected automatically"""
+
+    def _shared_resources(self) -> Tuple[socketpool.SocketPool, Session]:
+        return self.socket_pool, self.requests_session
+
+    @property
+    def ssl_context(self) -> "ssl.SSLContext":
+        """
+        Return the SSL context shared by MQTT and HTTP requests, creating it on first use
+        """
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+            self._resource_builds["ssl_context"] += 1
+        return self._ssl_context
+
+    @property
+    def socket_pool(self) -> "socketpool.SocketPool":
+        """
+        Return the socket pool shared by MQTT and HTTP requests, creating it on first use
+        """
+        if self._socket_pool is None:
+            self._socket_pool = socketpool.SocketPool(wifi.radio)
+            self._resource_builds["socket_pool"] += 1
+        return self._socket_pool
+
+    @property
+    def requests_session(self) -> Session:
+        """
+        Return the requests session used for HTTP, creating it on first use
+        """
+        if self._session is None:
+            self._session = adafruit_requests.Session(self.socket_pool, self.ssl_context)
+            self._resource_builds["session"] += 1
+        return self._session
+
+    def release_network_resources(self) -> None:
+        """Drop the shared socket pool, SSL context and requests session so they are created
+        again on next use. Disconnect MQTT before calling this. The next request or `connect`
+        goes through the WiFi connection again, which attaches the new session.
+        """
+        self._ssl_context = None
+        self._socket_pool = None
+        self._session = None
+        self._io_client = None
+        # Otherwise connect() is skipped and requests are made with no session
+        self._wifi.reset()
+        self.requests = None
+
+    @property
+    def resource_stats(self) -> Dict[str, int]:
+        """
+        Return how many times each shared network resource has been created
+        """
+        return dict(self._resource_builds)
+
+    def init_response_cache(self, max_entries: int = 4) -> None:
+        """Remember the parsed values of each fetched URL along with its ``ETag`` and
+        ``Last-Modified`` headers. Later fetches of the URL send ``If-None-Match`` and
+        ``If-Modified-Since``, and when the server answers ``304 Not Modified`` the remembered
+        values are returned without downloading, transforming or parsing the body again.
+
+        :param int max_entries: The number of URLs to remember. The oldest is forgotten when
+                                a new one is fetched. Defaults to 4.
+        """
+        self._response_cache = {}
+        self._response_cache_size = max_entries
+
+    def fetch_data(
+        self,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        json_path: Optional[Union[List[str], List[List[str]]]] = None,
+        regexp_path: Optional[Sequence[str]] = None,
+        timeout: int = 10,
+    ) -> Any:
+        """Fetch data from the specified url and perform any parsing. With
+        `init_response_cache`, unchanged responses are answered from the cache.
+
+        :param str url: The URL to fetch from.
+        :param dict headers: Extra headers to include in the request.
+        :param json_path: The path to drill down into the JSON data.
+        :param regexp_path: The path formatted as a regular expression to search
+                            the text data.
+        :param int timeout: The timeout period in seconds.
+        """
+        if self._response_cache is None:
+            return super().fetch_data(
+                url,
+                headers=headers,
+                json_path=json_path,
+                regexp_path=regexp_path,
+                timeout=timeout,
+            )
+        entry = self._response_cache.get(url)
+        if entry is not None and entry[2] != (json_path, regexp_path):
+            # Values parsed with other paths can't answer this fetch
+            entry = None
+        request_headers = dict(headers) if headers else {}
+        if entry is not None:
+            if entry[0]:
+                request_headers["If-None-Match"] = entry[0]
+            if entry[1]:
+                request_headers["If-Modified-Since"] = entry[1]
+        response = self.fetch(url, headers=request_headers, timeout=timeout)
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            self.response_cache_hits += 1
+            return entry[3]
+        response_headers = self._get_headers(response)
+        values = self._parse_data(response, json_path=json_path, regexp_path=regexp_path)
+        self.response_cache_misses += 1
+        self._response_cache.pop(url, None)
+        etag = response_headers.get("etag")
+        last_modified = response_headers.get("last-modified")
+        if etag or last_modified:
+            if len(self._response_cache) >= self._response_cache_size:
+                self._response_cache.pop(next(iter(self._response_cache)))
+            self._response_cache[url] = (
+                etag,
+                last_modified,
+                (json_path, regexp_path),
+                values,
+            )
+        return values
+
+    def enable_json_streaming(self, chunk_size: int = 256) -> None:
+        """Extract the ``json_path`` values while the response is read, instead of parsing
+        the whole response first. Only the selected values are kept, so large responses
+        don't run out of memory. Responses are still parsed whole when there is no
+        ``json_path``, when a ``json_transform`` is set, since it needs the whole document,
+        or when a path has a negative index.
+
+        :param int chunk_size: How many bytes to read from the response at a time.
+                               Defaults to 256.
+        """
+        self._json_chunk_size = chunk_size
+
+    def _parse_data(
+        self,
+        response: Response,
+        *,
+        json_path: Optional[Union[List[str], List[List[str]]]] = None,
+        regexp_path: Optional[Sequence[str]] = None,
+    ) -> Any:
+        if (
+            self._json_chunk_size is None
+            or not json_path
+            or self.json_transform
+            or self.uselocal
+            or response.status_code != 200
+            or self._detect_content_type(self._get_headers(response)) != CONTENT_JSON
+        ):
+            return super()._parse_data(response, json_path=json_path, regexp_path=regexp_path)
+        extractor = JsonPathExtractor(json_path)
+        for path in extractor.paths:
+            if any(isinstance(key, int) and key < 0 for key in path):
+                return super()._parse_data(response, json_path=json_path, regexp_path=regexp_path)
+        self.check_response(response)
+        for chunk in response.iter_content(self._json_chunk_size):
+            if extractor.feed(chunk):
+                break
+        # The rest of the body is not needed
+        response.close()
+        values = extractor.values()
+        if self._extract_values and len(values) == 1:
+            values = values[0]
+        gc.collect()
+        return values
+
+    def init_io_mqtt(self, socket_timeout: float = 1, connect_retries: int = 5) -> IO_MQTT:
+        """Initialize MQTT for Adafruit IO
 
-    def init_io_mqtt(self) -> IO_MQTT:
-        """Initialize MQTT for Adafruit IO"""
+        :param float socket_timeout: How long socket operations wait, in seconds. This is also
+                                     the shortest timeout `mqtt_loop` accepts. Defaults to 1.
+        :param int connect_retries: How many times each connect is attempted, with blocking
+                                    backoff in between. Defaults to 5.
+        """
         aio_username = self._get_setting["ADAFRUIT_AIO_USERNAME"]
         aio_key = self._get_setting["ADAFRUIT_AIO_KEY"]
         if None in {aio_username, aio_key}:
@@ -81,7 +369,15 @@ class Network(NetworkBase):
                 "Adafruit IO keys are kept in settings.toml, please add them there."
             )
 
-        return self.init_mqtt(IO_MQTT_BROKER, 8883, aio_username, aio_key, True)
+        return self.init_mqtt(
+            IO_MQTT_BROKER,
+            8883,
+            aio_username,
+            aio_key,
+            True,
+            socket_timeout=socket_timeout,
+            connect_retries=connect_retries,
+        )
 
     def init_mqtt(
         self,
@@ -90,16 +386,29 @@ class Network(NetworkBase):
         username: str = None,
         password: str = None,
         use_io: bool = False,
+        socket_timeout: float = 1,
+        connect_retries: int = 5,
     ) -> Union[MQTT.MQTT, IO_MQTT]:
-        """Initialize MQTT"""
+        """Initialize MQTT
+
+        :param float socket_timeout: How long socket operations wait, in seconds. This is also
+                                     the shortest timeout `mqtt_loop` accepts. Defaults to 1.
+        :param int connect_retries: How many times each connect is attempted, with blocking
+                                    backoff in between. Use 1 with `enable_auto_reconnect` so
+                                    the backoff does not block. Defaults to 5.
+        """
         self.connect()
-        self._mqtt_client = MQTT.MQTT(
+        self._mqtt_username = username
+        self._mqtt_socket_timeout = socket_timeout
+        self._mqtt_base_client = self._mqtt_client = MQTT.MQTT(
             broker=broker,
             port=port,
             username=username,
             password=password,
-            socket_pool=self._wifi.pool,
-            ssl_context=ssl.create_default_context(),
+            socket_pool=self.socket_pool,
+            ssl_context=self.ssl_context,
+            socket_timeout=socket_timeout,
+            connect_retries=connect_retries,
         )
         if use_io:
             self._mqtt_client = IO_MQTT(self._mqtt_client)
@@ -114,18 +423,35 @@ class Network(NetworkBase):
         raise RuntimeError("Please initialize MQTT before using")
 
     def mqtt_loop(self, *args: int, suppress_mqtt_errors: bool = True, **kwargs: int) -> None:
-        """Run the MQTT Loop"""
+        """Run the MQTT Loop. With `enable_auto_reconnect`, a lost connection is restored
+        here once its backoff delay has passed and the loop is skipped until then.
+        """
         self._get_mqtt_client()
+        if self._radio_paused:
+            return
         if suppress_mqtt_errors:
+            if not self._supervise_mqtt():
+                return
             try:
-                if self._mqtt_client is not None:
-                    self._mqtt_client.loop(*args, **kwargs)
-            except MQTT.MMQTTException as err:
+                if self._auto_reconnect and self._mqtt_client is not None:
+                    if not self._mqtt_base_client.is_connected():
+                        raise MMQTTException("MQTT is not connected")
+                self._loop_mqtt(args, kwargs)
+            except MMQTTException as err:
                 print(f"MMQTTException: {err}")
+                self._mqtt_fault()
             except OSError as err:
                 print(f"OSError: {err}")
-        elif self._mqtt_client is not None:
+                self._mqtt_fault()
+        else:
+            self._loop_mqtt(args, kwargs)
+
+    def _loop_mqtt(self, args: tuple, kwargs: dict) -> None:
+        if self._mqtt_client is not None:
             self._mqtt_client.loop(*args, **kwargs)
+            self._replay_stored()
+        if self._publish_queue is not None:
+            self._publish_queue.poll()
 
     def mqtt_publish(
         self,
@@ -133,19 +459,420 @@ class Network(NetworkBase):
         suppress_mqtt_errors: bool = True,
         **kwargs: Union[str, int, float],
     ) -> None:
-        """Publish to MQTT"""
+        """Publish to MQTT. Values that the `ReportingPolicy` of the feed rejects are dropped
+        before any network traffic. If the publish fails while errors are suppressed and
+        `init_store_and_forward` has been called, the value is kept to be sent later. A value
+        that was neither sent nor kept does not count as sent by the policy.
+        """
+        policy = self._policies.get(args[0]) if len(args) >= 2 else None
+        now = time.monotonic()
+        if policy is not None and not policy.check(args[1], now):
+            return
+        # Only a value that was sent or stored counts as the last value of the feed
+        if self._publish(args, kwargs, suppress_mqtt_errors) and policy is not None:
+            policy.commit(args[1], now)
+
+    def _publish(self, args: tuple, kwargs: dict, suppress_mqtt_errors: bool = True) -> bool:
         self._get_mqtt_client()
-        if suppress_mqtt_errors:
-            try:
-                if self._mqtt_client is not None:
-                    self._mqtt_client.publish(*args, **kwargs)
-            except OSError as err:
-                print(f"OSError: {err}")
-        elif self._mqtt_client is not None:
+        if not suppress_mqtt_errors:
+            self._mqtt_client.publish(*args, **kwargs)
+            return True
+
+        if self._next_reconnect is not None or self._radio_paused:
+            # Waiting to reconnect or for the radio, so don't touch the socket
+            return self._store_failed_publish(args)
+        try:
             self._mqtt_client.publish(*args, **kwargs)
+        except OSError as err:
+            print(f"OSError: {err}")
+        except MMQTTException as err:
+            if self._store is None and not self._auto_reconnect:
+                raise
+            print(f"MMQTTException: {err}")
+        else:
+            return True
+        self._mqtt_fault()
+        return self._store_failed_publish(args)
+
+    def push_batch_to_io(self, feed_key: str, samples: Sequence[Tuple[Any, int]]) -> None:
+        """Push several timestamped values to an Adafruit IO feed with one request to the
+        batch data endpoint. The timestamps are sent as UTC, so set the clock to UTC to have
+        them show the right time.
+
+        :param str feed_key: Name of feed key to push data to.
+        :param samples: ``(value, timestamp)`` pairs, with the timestamp in seconds since
+                        the epoch.
+        """
+        data = []
+        for value, timestamp in samples:
+            stamp = time.localtime(timestamp)
+            data.append(
+                {
+                    "value": value,
+                    "created_at": "{:04d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}Z".format(*stamp[0:6]),
+                }
+            )
+        if data:
+            self._get_io_client().send_batch_data(feed_key, data)
+
+    def init_frame_codec(
+        self, fields: Sequence[Tuple[str, str, float]], *, schema: int = 1
+    ) -> FrameCodec:
+        """Initialize the binary frame layout used by `mqtt_publish_frame`. Decode the frames
+        with a :py:class:`~adafruit_funhouse.telemetry.FrameCodec` made with the same fields,
+        or on a computer with ``examples/funhouse_frame_decoder.py``.
+
+        :param fields: A sequence of ``(name, format, scale)`` tuples, see
+                       :py:class:`~adafruit_funhouse.telemetry.FrameCodec`.
+        :param int schema: A number from 0 to 255 that identifies the layout. Defaults to 1.
+        """
+        self._frame_codec = FrameCodec(fields, schema=schema)
+        return self._frame_codec
+
+    def mqtt_publish_frame(
+        self,
+        topic: str,
+        values: Dict[str, float],
+        timestamp: Optional[int] = None,
+        *,
+        suppress_mqtt_errors: bool = True,
+    ) -> None:
+        """Publish several readings as one binary frame. Adafruit IO feeds only take text,
+        so this is meant for other brokers. Frames are not kept by store and forward.
+
+        :param str topic: The topic to publish to.
+        :param dict values: The readings, keyed by field name.
+        :param int timestamp: The time of the readings in seconds since the epoch. Defaults
+                              to `time.time()`.
+        """
+        if self._frame_codec is None:
+            raise RuntimeError("Please initialize the frame codec before using")
+        self._get_mqtt_client()
+        frame = self._frame_codec.encode(values, timestamp)
+        if not suppress_mqtt_errors:
+            self._mqtt_base_client.publish(topic, frame)
+            return
+        if self._next_reconnect is not None or self._radio_paused:
+            return
+
+        try:
+            self._mqtt_base_client.publish(topic, frame)
+        except (MMQTTException, OSError) as err:
+            print(f"Unable to publish frame: {err}")
+            self._mqtt_fault()
+
+    def init_store_and_forward(
+        self,
+        path: Optional[str] = "/telemetry.bin",
+        *,
+        capacity: int = 256,
+        batch_size: int = 16,
+    ) -> StoreAndForward:
+        """Keep the values of failed publishes in a bounded buffer and send them again once
+        MQTT works. Each successful `mqtt_loop` sends up to ``batch_size`` stored values.
+
+        :param str path: The file to keep the values in, or ``None`` to keep them in memory.
+                         Defaults to ``"/telemetry.bin"``.
+        :param int capacity: The number of values to keep. The oldest value is dropped when
+                             the buffer is full. Defaults to 256.
+        :param int batch_size: The largest number of stored values sent by one `mqtt_loop`.
+                               Defaults to 16.
+
+        With `init_io_mqtt`, values stored while the clock was set, such as with
+        ``get_local_time``, are replayed through the Adafruit IO batch data endpoint, see
+        `push_batch_to_io`, so they keep the time they were stored at. Values Adafruit IO
+        rejects are dropped, and after other failures the replay waits with the backoff of
+        `enable_auto_reconnect`. Values stored before the clock was set, and values for
+        other brokers, which have no standard field for the time, are published again
+        without it.
+        """
+        self._store = StoreAndForward(path, capacity=capacity)
+        self._replay_batch_size = batch_size
+        return self._store
+
+    def _store_failed_publish(self, args: tuple) -> bool:
+        if self._store is None or len(args) < 2:
+            return False
+        try:
+            self._store.append(args[0], args[1])
+        except (OSError, ValueError) as err:
+            print(f"Unable to store {args[0]}: {err}")
+            return False
+        return True
+
+    def _replay_stored(self) -> int:
+        if self._store is None or not len(self._store):
+            return 0
+        if self._mqtt_client is not self._mqtt_base_client:
+            return self._replay_stored_to_io()
+
+        def publish(feed: str, value: str, _timestamp: int) -> None:
+            self._mqtt_client.publish(feed, value)
+
+        return self._store.replay(publish, self._replay_batch_size)
+
+    def _replay_stored_to_io(self) -> int:
+        if self._next_replay is not None and time.monotonic() < self._next_replay:
+            return 0
+        records = self._store.peek(self._replay_batch_size)
+        unsent = []
+        feeds = {}
+        for record in records:
+            if record[2] < _CLOCK_SET:
+                # The time is meaningless, so send it like a new value
+                if unsent or not self._republish_stored(record):
+                    unsent.append(record)
+            else:
+                # Adafruit IO only keeps the time of a value sent to its batch endpoint
+                feeds.setdefault(record[0], []).append(record)
+        for feed, feed_records in feeds.items():
+            if unsent or not self._push_stored(feed, feed_records):
+                unsent.extend(feed_records)
+        # Put back what wasn't sent, order doesn't matter as each record keeps its time
+        self._store.discard(len(records))
+        for feed, value, timestamp in unsent:
+            self._store.append(feed, value, timestamp)
+        if unsent:
+            self._next_replay = time.monotonic() + self._backoff_delay(self._replay_attempt)
+            self._replay_attempt += 1
+        else:
+            self._next_replay = None
+            self._replay_attempt = 0
+        return len(records) - len(unsent)
+
+    def _republish_stored(self, record: Tuple[str, str, int]) -> bool:
+        try:
+            self._mqtt_client.publish(record[0], record[1])
+        except (MMQTTException, OSError) as err:
+            print(f"Unable to replay {record[0]}: {err}")
+            self._mqtt_fault()
+            return False
+        return True
+
+    def _push_stored(self, feed: str, records: List[Tuple[str, str, int]]) -> bool:
+        try:
+            self.push_batch_to_io(feed, [(value, timestamp) for _, value, timestamp in records])
+        except (AdafruitIO_ThrottleError, OSError, RuntimeError) as err:
+            print(f"Unable to replay {feed}, will retry: {err!r}")
+            return False
+        except (AdafruitIO_RequestError, TypeError, ValueError) as err:
+            if str(err).startswith("Adafruit IO Error 5"):
+                print(f"Unable to replay {feed}, will retry: {err}")
+                return False
+            # Adafruit IO rejected the values, so sending them again can't succeed
+            print(f"Dropping the stored values for {feed}: {err}")
+        return True
+
+    @property
+    def stored_count(self) -> int:
+        """
+        Return the number of values waiting in the store and forward buffer
+        """
+        return len(self._store) if self._store is not None else 0
+
+    def init_publish_queue(
+        self, *, max_size: int = 8, max_age: float = 10, group: Optional[str] = None
+    ) -> PublishQueue:
+        """Initialize the queue used by `queue_publish`. Repeated values for a feed are
+        coalesced to the latest one, and the queue is flushed when it holds ``max_size`` feeds
+        or its oldest value is ``max_age`` seconds old. `mqtt_loop` checks the age.
+
+        :param int max_size: The number of queued feeds that triggers a flush. Defaults to 8.
+        :param float max_age: The age of the oldest queued value, in seconds, that triggers a
+                              flush. Defaults to 10.
+        :param str group: The Adafruit IO group key to send all of the queued values to as a
+                          single group publish. Defaults to ``None``, to publish each feed.
+        """
+
+        def publish(feed: str, value: Union[str, int, float]) -> None:
+            if self._publish((feed, value), {}):
+                self._commit_policy(feed, value)
+
+        publish_group = None
+        if group is not None:
+
+            def publish_group(values: Dict[str, Any]) -> None:
+                self._publish_io_group(group, values)
+
+        self._publish_queue = PublishQueue(
+            publish, max_size=max_size, max_age=max_age, publish_group=publish_group
+        )
+        return self._publish_queue
+
+    def _publish_io_group(self, group: str, values: Dict[str, Any]) -> None:
+        self._get_mqtt_client()
+        if self._next_reconnect is not None or self._radio_paused:
+            # Waiting to reconnect or for the radio, so don't touch the socket
+            self._store_group(group, values)
+            return
+        try:
+            self._mqtt_base_client.publish(
+                f"{self._mqtt_username}/groups/{group}", json.dumps({"feeds": values})
+            )
+        except (MMQTTException, OSError) as err:
+            # The queue has already been emptied, so keep the values in the store
+            print(f"Unable to publish group {group}: {err}")
+            self._store_group(group, values)
+            self._mqtt_fault()
+            return
+        for feed, value in values.items():
+            self._commit_policy(feed, value)
+
+    def _store_group(self, group: str, values: Dict[str, Any]) -> None:
+        # Feeds in a group are keyed "group.feed" on Adafruit IO
+        for feed, value in values.items():
+            if self._store_failed_publish((f"{group}.{feed}", value)):
+                self._commit_policy(feed, value)
+
+    def queue_publish(self, feed: str, value: Union[str, int, float]) -> None:
+        """Queue a value to publish to a feed with the next flush of the publish queue.
+        Values that the `ReportingPolicy` of the feed rejects are dropped, and a value only
+        counts as sent by the policy once the flush has sent or stored it.
+
+        :param str feed: The feed or topic to publish to.
+        :param value: The value to publish.
+        """
+        policy = self._policies.get(feed)
+        if policy is None or policy.check(value):
+            self.publish_queue.put(feed, value)
+
+    def set_reporting_policy(
+        self,
+        feed: str,
+        *,
+        deadband: float = 0,
+        percent: float = 0,
+        min_interval: float = 0,
+        heartbeat: Optional[float] = None,
+    ) -> ReportingPolicy:
+        """Only publish values for a feed that change enough, see `ReportingPolicy`
+
+        .. code-block:: python
+
+            # Send temperature when it moves by more than 0.5C, and at least every 5 minutes
+            funhouse.network.set_reporting_policy("temperature", deadband=0.5, heartbeat=300)
+
+        :param str feed: The feed or topic the policy applies to.
+        :param float deadband: The smallest change that is sent. Defaults to 0, to send any
+                               change.
+        :param float percent: The smallest change that is sent, as a percentage of the last
+                              value sent. Defaults to 0.
+        :param float min_interval: The shortest time between two values, in seconds.
+                                   Defaults to 0.
+        :param float heartbeat: The longest time between two values, in seconds. Defaults to
+                                ``None``, to only send changes.
+        """
+        policy = ReportingPolicy(
+            deadband=deadband, percent=percent, min_interval=min_interval, heartbeat=heartbeat
+        )
+        self._policies[feed] = policy
+        return policy
+
+    def clear_reporting_policy(self, feed: str) -> None:
+        """Publish every value for a feed again
+
+        :param str feed: The feed or topic to remove the policy from.
+        """
+        self._policies.pop(feed, None)
+
+    def _commit_policy(self, feed: str, value: Union[str, int, float]) -> None:
+        policy = self._policies.get(feed)
+        if policy is not None:
+            policy.commit(value)
+
+    def flush_publish_queue(self) -> None:
+        """Publish every queued value now"""
+        self.publish_queue.flush()
+
+    @property
+    def publish_queue(self) -> PublishQueue:
+        """
+        Return the publish queue created by `init_publish_queue`
+        """
+        if self._publish_queue is None:
+            raise RuntimeError("Please initialize the publish queue before using")
+        return self._publish_queue
+
+    def enable_auto_reconnect(self, *, initial_delay: float = 1, max_delay: float = 60) -> None:
+        """Reconnect MQTT automatically after a failure. The existing client is reconnected
+        from `mqtt_loop` with jittered exponential backoff, and the topics subscribed with
+        `mqtt_subscribe` are subscribed again. Until then publishes are dropped, or kept if
+        `init_store_and_forward` has been called.
+
+        :param float initial_delay: The delay before the first reconnect, in seconds.
+                                    Defaults to 1.
+        :param float max_delay: The longest delay between reconnects, in seconds.
+                                Defaults to 60.
+        """
+        self._auto_reconnect = True
+        self._reconnect_initial_delay = initial_delay
+        self._reconnect_max_delay = max_delay
+
+    def _mqtt_fault(self) -> None:
+        if self._auto_reconnect and self._next_reconnect is None:
+            self._reconnect_attempt = 0
+            self._schedule_reconnect()
+
+    def _backoff_delay(self, attempt: int) -> float:
+        delay = min(self._reconnect_max_delay, self._reconnect_initial_delay * (2**attempt))
+        # Jitter spreads out devices that lost the same broker at the same time
+        return delay + random.random() * delay / 2
+
+    def _schedule_reconnect(self) -> None:
+        self._next_reconnect = time.monotonic() + self._backoff_delay(self._reconnect_attempt)
+        self._reconnect_attempt += 1
+
+    def _supervise_mqtt(self) -> bool:
+        if self._next_reconnect is None:
+            return True
+        if time.monotonic() < self._next_reconnect:
+            return False
+
+        try:
+            self._reconnect_mqtt()
+        except (MMQTTException, OSError, RuntimeError) as err:
+            print(f"MQTT reconnect failed: {err}")
+            self._schedule_reconnect()
+            return False
+        self._next_reconnect = None
+        self._reconnect_attempt = 0
+        self.mqtt_reconnects += 1
+        return True
+
+    def _reconnect_mqtt(self) -> None:
+        self._mqtt_base_client.reconnect(resub_topics=False)
+        for args, kwargs in self._mqtt_topics:
+            self._mqtt_client.subscribe(*args, **kwargs)
+
+    def mqtt_subscribe(self, *args: Union[str, int], **kwargs: Union[str, int]) -> None:
+        """Subscribe to MQTT. These subscriptions are restored by `enable_auto_reconnect`."""
+        self._get_mqtt_client().subscribe(*args, **kwargs)
+        if (args, kwargs) not in self._mqtt_topics:
+            self._mqtt_topics.append((args, kwargs))
+
+    def mqtt_unsubscribe(self, *args: Union[str, int], **kwargs: Union[str, int]) -> None:
+        """Unsubscribe from MQTT"""
+        self._get_mqtt_client().unsubscribe(*args, **kwargs)
+        if args:
+            self._mqtt_topics = [entry for entry in self._mqtt_topics if entry[0][:1] != args[:1]]
+
+    @property
+    def mqtt_socket_timeout(self) -> float:
+        """
+        Return the MQTT socket timeout, which is the shortest timeout `mqtt_loop` accepts
+        """
+        return self._mqtt_socket_timeout
+
+    @property
+    def mqtt_reconnecting(self) -> bool:
+        """
+        Return whether MQTT is waiting to be reconnected
+        """
+        return self._next_reconnect is not None
 
     def mqtt_connect(self, *args: Union[bool, str, int], **kwargs: Union[bool, str, int]) -> None:
-        """Connect to MQTT"""
+        """Connect to MQTT. With `enable_auto_reconnect`, the ``on_mqtt_connect`` handler is
+        also called each time the connection is restored."""
         self._get_mqtt_client()
         if self._mqtt_client is not None:
             self._mqtt_client.connect(*args, **kwargs)
@@ -221,6 +948,46 @@ class Network(NetworkBase):
     def on_mqtt_message(self, value: Callable) -> None:
         self._get_mqtt_client().on_message = value
 
+    def route(
+        self,
+        topic_or_feed: str,
+        handler: Callable[[str, Any], None],
+        parser: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        """Call ``handler`` with ``(topic, value)`` for each MQTT message on ``topic_or_feed``.
+        With Adafruit IO, routes are matched against the feed key. The MQTT ``+`` and ``#``
+        wildcards are supported. Messages that match no route go to the ``on_mqtt_message``
+        handler set before the first route. Subscribing to the topic is still needed.
+
+        .. code-block:: python
+
+            from adafruit_funhouse.routing import parse_color
+
+            funhouse.network.route("neopixels", lambda feed, color: dotstars.fill(color),
+                                   parser=parse_color)
+
+        :param str topic_or_feed: The topic or feed key to route.
+        :param handler: The function called with ``(topic, value)`` for each message.
+        :param parser: The function that turns the payload into the value, such as
+                       :py:func:`~adafruit_funhouse.routing.parse_int`,
+                       :py:func:`~adafruit_funhouse.routing.parse_float`,
+                       :py:func:`~adafruit_funhouse.routing.parse_color` or
+                       :py:func:`~adafruit_funhouse.routing.parse_json`. Defaults to ``None``,
+                       to pass the payload unchanged.
+        """
+        client = self._get_mqtt_client()
+        if client.on_message is not self._router:
+            self._router.default = client.on_message
+            client.on_message = self._router
+        self._router.add(topic_or_feed, handler, parser)
+
+    def unroute(self, topic_or_feed: str) -> None:
+        """Remove the route added for ``topic_or_feed`` with `route`
+
+        :param str topic_or_feed: The topic or feed key that was routed.
+        """
+        self._router.remove(topic_or_feed)
+
     @property
     def enabled(self) -> bool:
         """
@@ -232,3 +999,85 @@ class Network(NetworkBase):
     @enabled.setter
     def enabled(self, value: bool) -> None:
         self._wifi.enabled = bool(value)
+        if self._duty_cycle is not None:
+            self._duty_cycle.radio_changed(bool(value))
+
+    def init_duty_cycle(
+        self,
+        period: float = 300,
+        *,
+        window: float = 30,
+        queue_threshold: Optional[int] = None,
+        capacity: int = 64,
+    ) -> DutyCycle:
+        """Only power the radio up in scheduled windows, or early when enough publishes are
+        waiting. Call `duty_cycle_loop` regularly to switch the radio. While the radio is off,
+        `mqtt_publish` keeps values in the store and forward buffer, which is created in
+        memory if `init_store_and_forward` has not been called, and `mqtt_loop` does nothing.
+
+        :param float period: The time from the start of one window to the start of the next,
+                             in seconds. Defaults to 300.
+        :param float window: How long the radio stays on each time, in seconds. Defaults to 30.
+        :param int queue_threshold: The number of waiting values that starts a window early.
+                                    Defaults to ``None``, to only follow the schedule.
+        :param int capacity: The number of values to keep when the buffer is created here.
+                             Defaults to 64.
+        """
+        self._duty_cycle = DutyCycle(period=period, window=window, queue_threshold=queue_threshold)
+        if self._store is None:
+            self._store = StoreAndForward(None, capacity=capacity)
+        self._duty_cycle.radio_changed(self._wifi.enabled)
+        return self._duty_cycle
+
+    @property
+    def duty_cycle(self) -> DutyCycle:
+        """
+        Return the duty cycle policy, with its ``radio_on_time`` and ``connects`` counters
+        """
+        if self._duty_cycle is None:
+            raise RuntimeError("Please initialize the duty cycle before using")
+        return self._duty_cycle
+
+    @property
+    def _radio_paused(self) -> bool:
+        return self._duty_cycle is not None and not self._wifi.enabled
+
+    def duty_cycle_loop(self) -> bool:
+        """Turn the radio on or off as the duty cycle requires. When a window starts, WiFi
+        and MQTT are connected again and the waiting values are sent. Return whether the
+        radio is on.
+        """
+        if not self.duty_cycle.should_be_on(self.stored_count):
+            if self._wifi.enabled:
+                if self._mqtt_base_client is not None:
+                    self._pause_mqtt()
+                self.enabled = False
+            return False
+        if not self._wifi.enabled:
+            self.enabled = True
+        if not self.is_connected:
+            try:
+                self.connect(max_attempts=1)
+            except (OSError, RuntimeError) as err:
+                print(f"Duty cycle connect failed: {err}")
+                return True
+            self._duty_cycle.connects += 1
+            if self._mqtt_client is not None:
+                self._resume_mqtt()
+        return True
+
+    def _pause_mqtt(self) -> None:
+        try:
+            self._mqtt_base_client.disconnect()
+        except (MMQTTException, OSError) as err:
+            print(f"MQTT disconnect failed: {err}")
+
+    def _resume_mqtt(self) -> None:
+        try:
+            self._reconnect_mqtt()
+            # Send everything that waited for this window
+            while self._replay_stored():
+                pass
+        except (MMQTTException, OSError, RuntimeError) as err:
+            print(f"MQTT resume failed: {err}")
+            self._mqtt_fault()
@@ -27,6 +27,9 @@ Implementation Notes
 
 """
 
+import time
+from collections import namedtuple
+
 import adafruit_ahtx0
 import adafruit_dotstar
 import adafruit_dps310
@@ -35,44 +38,242 @@ import simpleio
 import touchio
 from analogio import AnalogIn
 from digitalio import DigitalInOut, Direction, Pull
+from micropython import const
+
+from adafruit_funhouse.inputs import (
+    BUTTON_NAMES,
+    CAPTOUCH_NAMES,
+    PIR_NAME,
+    SLIDER_POSITIONS,
+    InputScanner,
+    SliderDecoder,
+    TouchCalibration,
+)
+from adafruit_funhouse.lights import Animation, AnimationPlayer, BufferedPixels, FrameBuffer
+from adafruit_funhouse.sound import TonePlayer
 
 try:
-    from typing import Optional
+    from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+    import busio
 except ImportError:
     pass
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FunHouse.git"
 
+PERIPHERALS = ("dotstars", "light", "buttons", "captouch", "i2c", "dps310", "aht20", "led", "pir")
+"""The names of the peripherals that can be enabled or disabled"""
+
+_AHT20_CMD_TRIGGER = const(0xAC)
+_AHT20_STATUS_BUSY = const(0x80)
+
+EnvironmentReading = namedtuple(
+    "EnvironmentReading", ("temperature", "relative_humidity", "pressure", "timestamp")
+)
+"""A single reading of the environmental sensors. ``temperature`` is in degrees Celsius,
+``relative_humidity`` is a percentage (0 - 100), ``pressure`` is in hPa and ``timestamp`` is
+the value of `time.monotonic()` when the reading was taken."""
+
+
+class ReadCache:
+    """Keep the result of a sensor read while it is younger than ``max_age`` seconds
+
+    :param read: The function called to read the sensor when the cached value is stale.
+    :param float max_age: The number of seconds a value stays fresh. Defaults to 0, to
+                          always read the sensor.
+
+    Attributes:
+        hits (int): The number of reads answered from the cache.
+        misses (int): The number of reads that went to the sensor.
+    """
+
+    def __init__(self, read: Callable[[], Any], max_age: float = 0) -> None:
+        self._read = read
+        self.max_age = max_age
+        self._value = None
+        self._timestamp = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def value(self) -> Any:
+        """
+        Return the cached value if it is fresh, otherwise read the sensor
+        """
+        if self.fresh:
+            self.hits += 1
+            return self._value
+        now = time.monotonic()
+        self.misses += 1
+        self.update(self._read(), now)
+        return self._value
+
+    @property
+    def fresh(self) -> bool:
+        """
+        Return whether a cached value exists and is younger than ``max_age``. With a
+        ``max_age`` of 0 nothing is fresh, so the sensor is always read.
+        """
+        # time.monotonic() gets coarser with uptime, so a read in the same tick is not fresh
+        return (
+            self.max_age > 0
+            and self._timestamp is not None
+            and time.monotonic() - self._timestamp < self.max_age
+        )
+
+    @property
+    def timestamp(self) -> Optional[float]:
+        """
+        Return the `time.monotonic()` value of the cached reading or ``None`` if there is none
+        """
+        return self._timestamp
+
+    def update(self, value: Any, timestamp: Optional[float] = None) -> None:
+        """Store a value that was read outside of the cache"""
+        self._value = value
+        self._timestamp = time.monotonic() if timestamp is None else timestamp
+
+    def invalidate(self) -> None:
+        """Discard the cached value so the next read goes to the sensor"""
+        self._timestamp = None
+
+    def reset_stats(self) -> None:
+        """Reset the hit and miss counters"""
+        self.hits = 0
+        self.misses = 0
+
+
+class _Unused:
+    """Stands in for a disabled input"""
+
+    def __init__(self) -> None:
+        self.value = False
+        self.raw_value = 0
+        self.threshold = 0
+
 
 class Peripherals:
     """Peripherals Helper Class for the FunHouse Library
 
 
+    :param float aht20_max_age: The number of seconds a temperature and humidity reading is
+                                reused. Defaults to 0, to always read the sensor.
+    :param float dps310_max_age: The number of seconds a pressure reading is reused.
+                                 Defaults to 0, to always read the sensor.
+    :param float light_max_age: The number of seconds a light reading is reused.
+                                Defaults to 0, to always read the sensor.
+    :param bool calibrate_touch: Measure the baseline of every touch pad at startup and set
+                                 per-pad thresholds instead of the fixed default. The pads
+                                 must not be touched during startup. Defaults to ``False``.
+
+    :param enable: The names of the peripherals that may be used, from `PERIPHERALS`.
+                   Defaults to ``None``, to allow all of them.
+    :param disable: The names of peripherals that may not be used, from `PERIPHERALS`.
+                    Defaults to none.
+
+    Peripherals are created the first time they are used, so an application only pays the
+    startup time and memory for the ones it needs. Using a disabled peripheral raises a
+    ``RuntimeError``, and disabling ``"i2c"`` also disables the environmental sensors.
+
     Attributes:
-        dotstars (DotStar): The DotStars on the FunHouse board.
-            See https://circuitpython.readthedocs.io/projects/dotstar/en/latest/api.html
+        aht20_cache (ReadCache): The cache for the AHT20 temperature and humidity.
+        dps310_cache (ReadCache): The cache for the DPS310 pressure.
+        light_cache (ReadCache): The cache for the light sensor.
     """
 
-    def __init__(self) -> None:
-        # Dotstars
-        self.dotstars = adafruit_dotstar.DotStar(
-            board.DOTSTAR_CLOCK, board.DOTSTAR_DATA, 5, brightness=0.3
-        )
+    def __init__(
+        self,
+        *,
+        aht20_max_age: float = 0,
+        dps310_max_age: float = 0,
+        light_max_age: float = 0,
+        calibrate_touch: bool = False,
+        enable: Optional[Sequence[str]] = None,
+        disable: Sequence[str] = (),
+    ) -> None:
+        if enable is None:
+            enable = PERIPHERALS
+        for name in tuple(enable) + tuple(disable):
+            if name not in PERIPHERALS:
+                raise ValueError(f"Unknown peripheral {name}")
+        self._enabled = set(enable) - set(disable)
+        # Peripherals are created on first use
+        self._devices = {}
+
+        self._aht20_buf = bytearray(6)
+        self._aht20_pending = False
+        self._environment = None
+
+        # Sensor read caches
+        self.aht20_cache = ReadCache(self._read_aht20, aht20_max_age)
+        self.dps310_cache = ReadCache(self.read_pressure, dps310_max_age)
+        self.light_cache = ReadCache(lambda: self._light.value, light_max_age)
+
+        self._input_objects = None
+        self._inputs = None
+        self._slider_decoder = None
+        self._touch_calibration = None
+        self._frame_buffer = None
+        self._buffered_dotstars = None
+        self._animation_player = None
+        self._tone_player = None
+        if calibrate_touch:
+            self.touch_calibration.calibrate()
+
+    def _get(self, name: str) -> Any:
+        device = self._devices.get(name)
+        if device is None:
+            if name not in self._enabled:
+                raise RuntimeError(f"The {name} peripheral is disabled")
+            device = getattr(self, "_init_" + name)()
+            self._devices[name] = device
+        return device
+
+    def initialize(self, *names: str) -> None:
+        """Create the named peripherals now instead of on first use. With no names, every
+        enabled peripheral is created.
+
+        :param str names: Names from `PERIPHERALS`, such as ``"aht20"`` or ``"buttons"``.
+        """
+        for name in names or [name for name in PERIPHERALS if name in self._enabled]:
+            self._get(name)
+
+    def is_enabled(self, name: str) -> bool:
+        """Return whether a peripheral may be used
+
+        :param str name: A name from `PERIPHERALS`, such as ``"aht20"`` or ``"buttons"``.
+        """
+        return name in self._enabled
+
+    def is_initialized(self, name: str) -> bool:
+        """Return whether a peripheral has been created
+
+        :param str name: A name from `PERIPHERALS`, such as ``"aht20"`` or ``"buttons"``.
+        """
+        return name in self._devices
+
+    @staticmethod
+    def _init_dotstars() -> adafruit_dotstar.DotStar:
+        return adafruit_dotstar.DotStar(board.DOTSTAR_CLOCK, board.DOTSTAR_DATA, 5, brightness=0.3)
 
-        # Light Sensor
-        self._light = AnalogIn(board.LIGHT)
+    @staticmethod
+    def _init_light() -> AnalogIn:
+        return AnalogIn(board.LIGHT)
 
-        # Buttons
-        self._buttons = []
+    @staticmethod
+    def _init_buttons() -> list:
+        buttons = []
         for pin in (board.BUTTON_DOWN, board.BUTTON_SELECT, board.BUTTON_UP):
             switch = DigitalInOut(pin)
             switch.direction = Direction.INPUT
             switch.pull = Pull.DOWN
-            self._buttons.append(switch)
+            buttons.append(switch)
+        return buttons
 
-        # Cap Tocuh Pads
-        self._ctp = []
+    @staticmethod
+    def _init_captouch() -> list:
+        pads = []
         for pin in (
             board.CAP6,
             board.CAP7,
@@ -85,19 +286,128 @@ class Peripherals:
         ):
             cap = touchio.TouchIn(pin)
             cap.threshold = 20000
-            self._ctp.append(cap)
+            pads.append(cap)
+        return pads
+
+    @staticmethod
+    def _init_i2c() -> busio.I2C:
+        return board.I2C()
+
+    def _init_dps310(self) -> adafruit_dps310.DPS310:
+        return adafruit_dps310.DPS310(self.i2c)
+
+    def _init_aht20(self) -> adafruit_ahtx0.AHTx0:
+        return adafruit_ahtx0.AHTx0(self.i2c)
+
+    @staticmethod
+    def _init_led() -> DigitalInOut:
+        led = DigitalInOut(board.LED)
+        led.direction = Direction.OUTPUT
+        return led
+
+    @staticmethod
+    def _init_pir() -> DigitalInOut:
+        pir = DigitalInOut(board.PIR_SENSE)
+        pir.direction = Direction.INPUT
+        return pir
+
+    @property
+    def dotstars(self) -> Union[adafruit_dotstar.DotStar, BufferedPixels]:
+        """
+        Return the DotStars on the FunHouse board.
+        See https://circuitpython.readthedocs.io/projects/dotstar/en/latest/api.html
 
-        self.i2c = board.I2C()
-        self._dps310 = adafruit_dps310.DPS310(self.i2c)
-        self._aht20 = adafruit_ahtx0.AHTx0(self.i2c)
+        Once the `frame_buffer` is used, this returns a
+        :py:class:`~adafruit_funhouse.lights.BufferedPixels` that writes through it instead,
+        with the same ``auto_write`` and brightness behavior.
+        """
+        if self._buffered_dotstars is not None:
+            return self._buffered_dotstars
+        return self._get("dotstars")
+
+    @property
+    def i2c(self) -> busio.I2C:
+        """
+        Return the I2C bus of the environmental sensors
+        """
+        return self._get("i2c")
+
+    @property
+    def _light(self) -> AnalogIn:
+        return self._get("light")
+
+    @property
+    def _buttons(self) -> list:
+        return self._get("buttons")
+
+    @property
+    def _ctp(self) -> list:
+        return self._get("captouch")
+
+    @property
+    def _dps310(self) -> adafruit_dps310.DPS310:
+        return self._get("dps310")
+
+    @property
+    def _aht20(self) -> adafruit_ahtx0.AHTx0:
+        return self._get("aht20")
+
+    @property
+    def _led(self) -> DigitalInOut:
+        return self._get("led")
+
+    @property
+    def _pir(self) -> DigitalInOut:
+        return self._get("pir")
+
+    def _optional(self, name: str, count: int) -> tuple:
+        # Disabled inputs read as untouched so input masks keep their bit layout
+        if name in self._enabled:
+            device = self._get(name)
+            return tuple(device) if isinstance(device, list) else (device,)
+        return tuple(_Unused() for _ in range(count))
+
+    @property
+    def _inputs_in_bit_order(self) -> tuple:
+        if self._input_objects is None:
+            self._input_objects = (
+                self._optional("buttons", 3)
+                + self._optional("captouch", 8)
+                + self._optional("pir", 1)
+            )
+        return self._input_objects
+
+    @property
+    def inputs(self) -> InputScanner:
+        """
+        Return the debounced event scanner for the buttons, the touch pads and the PIR sensor.
+        Call ``inputs.scan()`` from the main loop.
+        """
+        if self._inputs is None:
+            self._inputs = InputScanner(
+                tuple(zip(BUTTON_NAMES + CAPTOUCH_NAMES + (PIR_NAME,), self._inputs_in_bit_order))
+            )
+        return self._inputs
 
-        # LED
-        self._led = DigitalInOut(board.LED)
-        self._led.direction = Direction.OUTPUT
+    @property
+    def slider_decoder(self) -> SliderDecoder:
+        """
+        Return the slider decoder with interpolation, velocity and gestures. Call
+        ``slider_decoder.update()`` from the main loop.
+        """
+        if self._slider_decoder is None:
+            self._slider_decoder = SliderDecoder(self._ctp[3:8])
+        return self._slider_decoder
 
-        # PIR Sensor
-        self._pir = DigitalInOut(board.PIR_SENSE)
-        self._pir.direction = Direction.INPUT
+    @property
+    def touch_calibration(self) -> TouchCalibration:
+        """
+        Return the touch pad baseline calibration. Call ``touch_calibration.update()``
+        periodically to follow drift.
+        """
+        if self._touch_calibration is None:
+            self._touch_calibration = TouchCalibration(self._ctp)
+        return self._touch_calibration
 
     @staticmethod
     def play_tone(frequency: float, duration: float) -> None:
@@ -118,21 +428,121 @@ class Peripherals:
                 pass
             attempt += 1
 
+    @property
+    def tone_player(self) -> TonePlayer:
+        """
+        Return the non-blocking tone player of the speaker. Call ``tone_player.update()``
+        or `update_tones` from the main loop.
+        """
+        if self._tone_player is None:
+            self._tone_player = TonePlayer(board.SPEAKER)
+        return self._tone_player
+
+    def queue_tone(self, frequency: float, duration: float) -> None:
+        """Play a tone without blocking, after any tones already queued. Unlike `play_tone`
+        this returns at once, and `update_tones` ends the tone when it is due.
+
+        :param float frequency: The frequency in Hz, or 0 for a rest.
+        :param float duration: How long to play it, in seconds.
+        """
+        self.tone_player.play(frequency, duration)
+
+    def queue_melody(self, notes: Sequence[Tuple[float, float]]) -> None:
+        """Play a sequence of ``(frequency, duration)`` tones without blocking
+
+        :param notes: The tones to play. Use a frequency of 0 for a rest.
+        """
+        self.tone_player.play_melody(notes)
+
+    def update_tones(self) -> bool:
+        """Advance the queued tones. Return whether a tone is playing or queued."""
+        if self._tone_player is None:
+            return False
+        return self._tone_player.update()
+
     def set_dotstars(self, *values: int) -> None:
-        """Set the dotstar values to the provided values"""
-        for i, value in enumerate(values[: len(self.dotstars)]):
-            self.dotstars[i] = value
+        """Set the dotstar values to the provided values and send them in one transfer"""
+        count = min(len(values), len(self.dotstars))
+        if self._frame_buffer is None:
+            self.dotstars[0:count] = values[:count]
+            return
+        for i in range(count):
+            self._frame_buffer[i] = values[i]
+        self._frame_buffer.show()
+
+    @property
+    def frame_buffer(self) -> FrameBuffer:
+        """
+        Return the DotStar frame buffer. Write pixels to it and call ``frame_buffer.show()``
+        to send them all at once. From then on `dotstars` writes through it as well.
+        """
+        if self._frame_buffer is None:
+            dotstars = self._get("dotstars")
+            auto_write = dotstars.auto_write
+            self._frame_buffer = FrameBuffer(dotstars)
+            # Start from what the DotStars show
+            for i in range(len(self._frame_buffer)):
+                self._frame_buffer[i] = dotstars[i]
+            self._buffered_dotstars = BufferedPixels(self._frame_buffer, auto_write=auto_write)
+        return self._frame_buffer
+
+    @property
+    def dotstar_brightness(self) -> float:
+        """
+        Get or Set the DotStar brightness from 0.0 to 1.0 through the `frame_buffer`. The
+        pixels are only sent again when the brightness changes.
+        """
+        return self.frame_buffer.brightness
+
+    @dotstar_brightness.setter
+    def dotstar_brightness(self, value: float) -> None:
+        self.frame_buffer.brightness = value
+        self.frame_buffer.show()
+
+    def play_animation(self, animation: Animation) -> None:
+        """Start playing an animation on the DotStars. Call `update_animation` from the main
+        loop to show its frames.
+
+        :param animation: The :py:class:`~adafruit_funhouse.lights.Animation` to play.
+        """
+        if self._animation_player is None:
+            self._animation_player = AnimationPlayer(self.frame_buffer)
+        self._animation_player.play(animation)
+
+    def update_animation(self) -> bool:
+        """Show the animation frame that is due, with one transfer when it changes.
+        Return whether an animation is playing.
+        """
+        if self._animation_player is None:
+            return False
+        return self._animation_player.update()
+
+    def stop_animation(self) -> None:
+        """Stop the animation, leaving its current frame on the DotStars"""
+        if self._animation_player is not None:
+            self._animation_player.stop()
 
     def deinit(self) -> None:
-        """Call deinit on all resources to free them"""
-        self.dotstars.deinit()
-        for button in self._buttons:
-            button.deinit()
-        for ctp in self._ctp:
-            ctp.deinit()
-        self._light.deinit()
-        self._led.deinit()
-        self._pir.deinit()
+        """Call deinit on all resources that have been created to free them"""
+        if self._tone_player is not None:
+            self._tone_player.deinit()
+            self._tone_player = None
+        devices = self._devices
+        for name in ("dotstars", "light", "led", "pir"):
+            if name in devices:
+                devices[name].deinit()
+        for name in ("buttons", "captouch"):
+            for device in devices.get(name, ()):
+                device.deinit()
+        devices.clear()
+        self._input_objects = None
+        self._inputs = None
+        self._slider_decoder = None
+        self._touch_calibration = None
+        self._frame_buffer = None
+        self._buffered_dotstars = None
+        self._animation_player = None
+        self._tone_player = None
 
     @property
     def button_down(self) -> bool:
@@ -160,7 +570,39 @@ class Peripherals:
         """
         Return whether any button is pressed
         """
-        return True in [button.value for (i, button) in enumerate(self._buttons)]
+        for button in self._buttons:
+            if button.value:
+                return True
+        return False
+
+    def read_input(self, name: str) -> bool:
+        """Return whether a button or touch pad is pressed, or whether the PIR sensor sees
+        motion
+
+        :param str name: The input name, such as ``"button_up"``, ``"captouch9"`` or
+                         ``"pir_sensor"``, see :py:mod:`adafruit_funhouse.inputs`.
+        """
+        if name in BUTTON_NAMES:
+            return self._buttons[BUTTON_NAMES.index(name)].value
+        if name in CAPTOUCH_NAMES:
+            return self._ctp[CAPTOUCH_NAMES.index(name)].value
+        if name == PIR_NAME:
+            return self.pir_sensor
+        raise ValueError(f"Unknown input {name}")
+
+    @property
+    def input_state(self) -> int:
+        """
+        Return the buttons, touch pads and PIR sensor sampled in one pass as a bitmask. The
+        bits are defined in :py:mod:`adafruit_funhouse.inputs`, such as ``BUTTON_UP_BIT``.
+        """
+        mask = 0
+        bit = 1
+        for item in self._inputs_in_bit_order:
+            if item.value:
+                mask |= bit
+            bit <<= 1
+        return mask
 
     @property
     def captouch6(self) -> bool:
@@ -183,17 +625,20 @@ class Peripherals:
         """
         return self._ctp[2].value
 
+    @property
+    def captouch_raw(self) -> Tuple[int, ...]:
+        """
+        Return the raw counts of the eight Touch Pads, in the order CT6, CT7, CT8, CT13, CT12,
+        CT11, CT10 and CT9
+        """
+        return tuple(pad.raw_value for pad in self._ctp)
+
     @property
     def slider(self) -> Optional[float]:
         """
         Return the slider position value in the range of 0.0-1.0 or None if not touched
         """
-        val = 0
-        cap_map = (0x01, 0x03, 0x02, 0x06, 0x04, 0x0C, 0x08, 0x18, 0x10)
-        for cap in range(5):
-            if self._ctp[cap + 3].value:
-                val += 1 << (cap)
-        return cap_map.index(val) / 8 if val in cap_map else None
+        return SLIDER_POSITIONS[self.slider_decoder.read_mask()]
 
     @property
     def light(self) -> int:
@@ -213,28 +658,155 @@ class Peripherals:
                 time.sleep(0.01)
 
         """
-        return self._light.value
+        return self.light_cache.value
+
+    def start_aht20_measurement(self) -> None:
+        """Start an AHT20 temperature and humidity conversion and return immediately. Use
+        `poll_aht20` to collect the result once the conversion, which takes about 80ms, is done.
+        Nothing is sent if a conversion is already in progress.
+
+        .. code-block:: python
+
+            from adafruit_funhouse import FunHouse
+
+            funhouse = FunHouse()
+
+            funhouse.peripherals.start_aht20_measurement()
+            while True:
+                result = funhouse.peripherals.poll_aht20()
+                if result is not None:
+                    temperature, humidity = result
+                    print(temperature, humidity)
+                    funhouse.peripherals.start_aht20_measurement()
+                # Do other work here
+
+        """
+        if self._aht20_pending:
+            return
+        self._aht20_buf[0] = _AHT20_CMD_TRIGGER
+        self._aht20_buf[1] = 0x33
+        self._aht20_buf[2] = 0x00
+        with self._aht20.i2c_device as i2c:
+            i2c.write(self._aht20_buf, end=3)
+        self._aht20_pending = True
+
+    def poll_aht20(self) -> Optional[tuple]:
+        """Check on the conversion started with `start_aht20_measurement` without blocking.
+        Return a ``(temperature, relative_humidity)`` tuple when it is done or ``None`` while
+        the sensor is still busy.
+        """
+        if not self._aht20_pending:
+            raise RuntimeError("Please start an AHT20 measurement before polling")
+        buf = self._aht20_buf
+        # The status byte and the data are read together so a finished poll is one transaction
+        with self._aht20.i2c_device as i2c:
+            i2c.readinto(buf, end=6)
+        if buf[0] & _AHT20_STATUS_BUSY:
+            return None
+        self._aht20_pending = False
+        humidity = (buf[1] << 12) | (buf[2] << 4) | (buf[3] >> 4)
+        temperature = ((buf[3] & 0xF) << 16) | (buf[4] << 8) | buf[5]
+        result = (((temperature * 200.0) / 0x100000) - 50, (humidity * 100) / 0x100000)
+        self.aht20_cache.update(result)
+        return result
+
+    @property
+    def aht20_busy(self) -> bool:
+        """
+        Return whether an AHT20 conversion has been started and not yet collected
+        """
+        return self._aht20_pending
+
+    def _read_aht20(self) -> tuple:
+        # A single conversion provides both values, so read them together
+        self.start_aht20_measurement()
+        while True:
+            result = self.poll_aht20()
+            if result is not None:
+                return result
+            time.sleep(0.01)
+
+    def read_environment(self) -> EnvironmentReading:
+        """Read the temperature, relative humidity and pressure with a single AHT20 conversion
+        and a single DPS310 read and return them as an `EnvironmentReading`.
+
+        .. code-block:: python
+
+            from adafruit_funhouse import FunHouse
+
+            funhouse = FunHouse()
+
+            reading = funhouse.peripherals.read_environment()
+            print(reading.temperature, reading.relative_humidity, reading.pressure)
+
+        """
+        temperature, humidity = self._read_aht20()
+        return self.record_environment(temperature, humidity, self.read_pressure())
+
+    def read_pressure(self) -> float:
+        """Read the barometric pressure in hPa from the DPS310, skipping the cache"""
+        return self._dps310.pressure
+
+    def record_environment(
+        self, temperature: float, humidity: float, pressure: float
+    ) -> EnvironmentReading:
+        """Store readings taken outside of `read_environment` in the sensor caches and
+        `environment`, and return them as an `EnvironmentReading`
+
+        :param float temperature: The temperature in degrees Celsius.
+        :param float humidity: The relative humidity as a percentage (0 - 100).
+        :param float pressure: The barometric pressure in hPa.
+        """
+        now = time.monotonic()
+        self.aht20_cache.update((temperature, humidity), now)
+        self.dps310_cache.update(pressure, now)
+        self._environment = EnvironmentReading(temperature, humidity, pressure, now)
+        return self._environment
+
+    def invalidate(self) -> None:
+        """Discard all cached sensor values so the next reads go to the sensors"""
+        self.aht20_cache.invalidate()
+        self.dps310_cache.invalidate()
+        self.light_cache.invalidate()
+
+    @property
+    def cache_stats(self) -> Dict[str, tuple]:
+        """
+        Return the ``(hits, misses)`` counters of each sensor cache
+        """
+        return {
+            "aht20": (self.aht20_cache.hits, self.aht20_cache.misses),
+            "dps310": (self.dps310_cache.hits, self.dps310_cache.misses),
+            "light": (self.light_cache.hits, self.light_cache.misses),
+        }
+
+    @property
+    def environment(self) -> Optional[EnvironmentReading]:
+        """
+        Return the last reading taken by `read_environment` or ``None`` if there is none
+        """
+        return self._environment
 
     @property
     def temperature(self) -> float:
         """
         Return the temperature in degrees Celsius
         """
-        return self._aht20.temperature
+        return self.aht20_cache.value[0]
 
     @property
     def relative_humidity(self) -> float:
         """
         Return the relative humidity as a percentage (0 - 100)
         """
-        return self._aht20.relative_humidity
+        return self.aht20_cache.value[1]
 
     @property
     def pressure(self) -> float:
         """
         Return the barometric pressure in hPa, or equivalently in mBar
         """
-        return self._dps310.pressure
+        return self.dps310_cache.value
 
     @property
     def led(self) -> bool:
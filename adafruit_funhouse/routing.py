@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_funhouse.routing`
+================================================================================
+
+Inbound MQTT message routing for the Adafruit FunHouse board.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit FunHouse <https://www.adafruit.com/product/4985>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+import json
+
+try:
+    from typing import Any, Callable, Optional, Tuple
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FunHouse.git"
+
+# The key that holds the route of a wildcard trie node, no topic level can be None
+_ROUTE = None
+
+
+def parse_int(payload: str) -> int:
+    """Parse a payload such as ``"1"`` into an int"""
+    return int(payload)
+
+
+def parse_float(payload: str) -> float:
+    """Parse a payload such as ``"21.5"`` into a float"""
+    return float(payload)
+
+
+def parse_color(payload: str) -> int:
+    """Parse a hex color payload such as ``"#FF8000"``, ``"0xFF8000"`` or ``"FF8000"`` into
+    an int such as ``0xFF8000``
+    """
+    payload = payload.strip()
+    if payload.startswith("#"):
+        payload = payload[1:]
+    elif payload[:2] in {"0x", "0X"}:
+        payload = payload[2:]
+    return int(payload, 16)
+
+
+def parse_json(payload: str) -> Any:
+    """Parse a JSON payload"""
+    return json.loads(payload)
+
+
+class TopicRouter:
+    """Dispatches MQTT messages to handlers by topic. Topics without wildcards are found with
+    a single dict lookup, and topics with the MQTT ``+`` and ``#`` wildcards are kept in a
+    tree with one level per topic level, so dispatch does not slow down as routes are added.
+    When several routes match, an exact topic wins over ``+``, which wins over ``#``.
+
+    An instance can be used directly as a MiniMQTT or Adafruit IO ``on_message`` callback.
+
+    :param default: The function called with ``(client, topic, payload)`` for messages that
+                    match no route. Defaults to ``None``, to ignore them.
+    """
+
+    def __init__(self, default: Optional[Callable] = None) -> None:
+        self.default = default
+        self._exact = {}
+        self._wildcards = {}
+
+    def add(
+        self,
+        topic: str,
+        handler: Callable[[str, Any], None],
+        parser: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        """Route messages on ``topic`` to ``handler``, replacing any route for the same topic
+
+        :param str topic: The topic or feed key, which may contain ``+`` and ``#`` wildcards.
+        :param handler: The function called with ``(topic, value)`` for each message.
+        :param parser: The function that turns the payload into the value, such as
+                       `parse_int`. Defaults to ``None``, to pass the payload unchanged.
+        """
+        route = (handler, parser)
+        if "+" not in topic and "#" not in topic:
+            self._exact[topic] = route
+            return
+        node = self._wildcards
+        for level in topic.split("/"):
+            node = node.setdefault(level, {})
+        node[_ROUTE] = route
+
+    def remove(self, topic: str) -> None:
+        """Remove the route for ``topic`` if there is one
+
+        :param str topic: The topic or feed key the route was added with.
+        """
+        if topic in self._exact:
+            del self._exact[topic]
+            return
+        node = self._wildcards
+        for level in topic.split("/"):
+            node = node.get(level)
+            if node is None:
+                return
+        node.pop(_ROUTE, None)
+
+    def match(self, topic: str) -> Optional[Tuple[Callable, Optional[Callable]]]:
+        """Return the ``(handler, parser)`` route for ``topic`` or ``None`` if none matches
+
+        :param str topic: The topic or feed key of a message.
+        """
+        route = self._exact.get(topic)
+        if route is None and self._wildcards:
+            route = self._match(self._wildcards, topic.split("/"), 0)
+        return route
+
+    def _match(self, node: dict, levels: list, index: int) -> Optional[Tuple]:
+        if index == len(levels):
+            route = node.get(_ROUTE)
+            if route is None and "#" in node:
+                # "a/#" also matches "a"
+                route = node["#"].get(_ROUTE)
+            return route
+        for key in (levels[index], "+"):
+            child = node.get(key)
+            if child is not None:
+                route = self._match(child, levels, index + 1)
+                if route is not None:
+                    return route
+        if "#" in node:
+            return node["#"].get(_ROUTE)
+        return None
+
+    def dispatch(self, topic: str, payload: str) -> bool:
+        """Call the handler routed for ``topic`` with the parsed payload. Payloads the parser
+        rejects are printed and dropped. Return whether a route matched.
+
+        :param str topic: The topic or feed key of the message.
+        :param str payload: The message payload.
+        """
+        route = self.match(topic)
+        if route is None:
+            return False
+        handler, parser = route
+        if parser is not None:
+            try:
+                payload = parser(payload)
+            except ValueError as err:
+                print(f"Could not parse {topic} payload {payload!r}: {err}")
+                return True
+        handler(topic, payload)
+        return True
+
+    def __call__(self, client: Any, topic: str, payload: str) -> None:
+        if not self.dispatch(topic, payload) and self.default is not None:
+            self.default(client, topic, payload)
+
+    def __len__(self) -> int:
+        return len(self._exact) + self._count(self._wildcards)
+
+    def _count(self, node: dict) -> int:
+        return sum(self._count(child) if key is not _ROUTE else 1 for key, child in node.items())
@@ -0,0 +1,174 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_funhouse.scheduler`
+================================================================================
+
+Cooperative task scheduler for the Adafruit FunHouse board.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit FunHouse <https://www.adafruit.com/product/4985>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+import time
+
+try:
+    from typing import Callable, List, Optional
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FunHouse.git"
+
+
+class Task:
+    """A function run by a `Scheduler`, either every ``interval`` seconds or once
+
+    :param callback: The function to call, without arguments.
+    :param float interval: The time between runs in seconds, or ``None`` to run once.
+    :param float deadline: The `time.monotonic()` value of the first run.
+    :param int priority: Tasks with a higher priority run first when several are due.
+
+    Attributes:
+        runs (int): The number of times the task has run.
+        max_jitter (float): The longest a run started after its deadline, in seconds.
+        total_jitter (float): The sum of how late each run started, in seconds.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[], None],
+        interval: Optional[float],
+        deadline: float,
+        priority: int,
+    ) -> None:
+        self.callback = callback
+        self.interval = interval
+        self.deadline = deadline
+        self.priority = priority
+        self.runs = 0
+        self.max_jitter = 0
+        self.total_jitter = 0
+
+    @property
+    def mean_jitter(self) -> float:
+        """
+        Return the average time a run started after its deadline, in seconds
+        """
+        return self.total_jitter / self.runs if self.runs else 0
+
+    def _run(self, now: float) -> None:
+        late = now - self.deadline
+        self.runs += 1
+        self.total_jitter += late
+        self.max_jitter = max(self.max_jitter, late)
+        if self.interval is not None:
+            self.deadline += self.interval
+            if self.deadline <= now:
+                # Too far behind to catch up, so skip the missed runs
+                self.deadline = now + self.interval
+        self.callback()
+
+
+class Scheduler:
+    """Runs periodic and one-shot tasks from a single loop and sleeps until the next one
+    is due, instead of polling `time.monotonic()` in a ``while True`` loop.
+    """
+
+    def __init__(self) -> None:
+        self.tasks = []
+        """The scheduled `Task` objects"""
+
+    def every(self, interval: float, callback: Callable[[], None], *, priority: int = 0) -> Task:
+        """Run ``callback`` every ``interval`` seconds, starting now
+
+        :param float interval: The time between runs, in seconds.
+        :param callback: The function to call, without arguments.
+        :param int priority: Tasks with a higher priority run first when several are due.
+                             Defaults to 0.
+        """
+        return self._add(Task(callback, interval, time.monotonic(), priority))
+
+    def after(self, delay: float, callback: Callable[[], None], *, priority: int = 0) -> Task:
+        """Run ``callback`` once, ``delay`` seconds from now
+
+        :param float delay: The time until the run, in seconds.
+        :param callback: The function to call, without arguments.
+        :param int priority: Tasks with a higher priority run first when several are due.
+                             Defaults to 0.
+        """
+        return self._add(Task(callback, None, time.monotonic() + delay, priority))
+
+    def _add(self, task: Task) -> Task:
+        self.tasks.append(task)
+        return task
+
+    def cancel(self, task: Task) -> None:
+        """Stop running a task
+
+        :param task: A task returned by `every` or `after`.
+        """
+        if task in self.tasks:
+            self.tasks.remove(task)
+
+    def next_deadline(self) -> Optional[float]:
+        """Return the `time.monotonic()` value when the next task is due, or ``None`` if
+        there are no tasks
+        """
+        if not self.tasks:
+            return None
+        return min(task.deadline for task in self.tasks)
+
+    def run_pending(self, now: Optional[float] = None) -> List[Task]:
+        """Run every task that is due, highest priority first. Return the tasks that ran.
+
+        :param float now: The `time.monotonic()` value to use. Defaults to reading the clock
+                          before each task, so the time spent in earlier tasks counts as
+                          lateness.
+        """
+        clock = now
+        if now is None:
+            now = time.monotonic()
+        due = [task for task in self.tasks if task.deadline <= now]
+        due.sort(key=lambda task: (-task.priority, task.deadline))
+        ran = []
+        for task in due:
+            if task not in self.tasks:
+                # Cancelled by a task that ran before it
+                continue
+            if task.interval is None:
+                self.tasks.remove(task)
+            task._run(time.monotonic() if clock is None else clock)
+            ran.append(task)
+        return ran
+
+    def run(self, sleep: Optional[Callable[[float], None]] = None) -> None:
+        """Run the tasks until none are left, sleeping while nothing is due
+
+        :param sleep: The function called with the number of seconds until the next task
+                      is due. Defaults to `time.sleep`.
+        """
+        if sleep is None:
+            sleep = time.sleep
+        while self.tasks:
+            self.run_pending()
+            deadline = self.next_deadline()
+            if deadline is None:
+                break
+            wait = deadline - time.monotonic()
+            if wait > 0:
+                sleep(wait)
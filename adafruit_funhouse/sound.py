@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_funhouse.sound`
+================================================================================
+
+Non-blocking tones for the Adafruit FunHouse speaker.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit FunHouse <https://www.adafruit.com/product/4985>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+import time
+
+import pwmio
+
+try:
+    from typing import Optional, Sequence, Tuple
+
+    import microcontroller
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FunHouse.git"
+
+_DUTY_ON = 0x8000
+
+
+class TonePlayer:
+    """Plays a queue of tones on a PWM pin without blocking. `play` and `play_melody` only
+    queue the notes, and `update`, called from the main loop or an async task, starts each
+    note when the previous one has finished. The PWM output is released between melodies
+    so other code can use the pin.
+
+    :param pin: The pin of the speaker, such as ``board.SPEAKER``.
+    :param int max_notes: The largest number of queued notes. Notes queued beyond it are
+                          dropped. Defaults to 32.
+    """
+
+    def __init__(self, pin: microcontroller.Pin, *, max_notes: int = 32) -> None:
+        self._pin = pin
+        self.max_notes = max_notes
+        self._notes = []
+        self._pwm = None
+        self._note_end = None
+        self.dropped = 0
+        """The number of notes dropped because the queue was full"""
+
+    def play(self, frequency: float, duration: float) -> None:
+        """Queue a tone
+
+        :param float frequency: The frequency in Hz, or 0 for a rest.
+        :param float duration: How long to play it, in seconds.
+        """
+        if frequency < 0:
+            raise ValueError("Negative frequencies are not allowed.")
+        if len(self._notes) >= self.max_notes:
+            self.dropped += 1
+            return
+        self._notes.append((frequency, duration))
+        self.update()
+
+    def play_melody(self, notes: Sequence[Tuple[float, float]]) -> None:
+        """Queue several tones
+
+        :param notes: A sequence of ``(frequency, duration)`` tuples. Use a frequency of 0
+                      for a rest.
+        """
+        for frequency, duration in notes:
+            self.play(frequency, duration)
+
+    def stop(self) -> None:
+        """Stop the current tone and drop the queued ones"""
+        self._notes = []
+        self._note_end = None
+        self._release()
+
+    @property
+    def playing(self) -> bool:
+        """
+        Return whether a tone is playing or queued
+        """
+        return self._note_end is not None or bool(self._notes)
+
+    def update(self, now: Optional[float] = None) -> bool:
+        """Start the next tone if the current one has finished. Return `playing`.
+
+        :param float now: The `time.monotonic()` value to use. Defaults to reading the clock.
+        """
+        if now is None:
+            now = time.monotonic()
+        if self._note_end is not None and now < self._note_end:
+            return True
+        if not self._notes:
+            self._note_end = None
+            self._release()
+            return False
+        frequency, duration = self._notes.pop(0)
+        if frequency > 0:
+            if self._pwm is None:
+                self._pwm = pwmio.PWMOut(
+                    self._pin,
+                    frequency=int(frequency),
+                    duty_cycle=_DUTY_ON,
+                    variable_frequency=True,
+                )
+            else:
+                self._pwm.frequency = int(frequency)
+                self._pwm.duty_cycle = _DUTY_ON
+        elif self._pwm is not None:
+            self._pwm.duty_cycle = 0
+        # Measured from the end of the last note so a late update doesn't stretch the melody
+        start = now if self._note_end is None else self._note_end
+        self._note_end = start + duration
+        return True
+
+    def _release(self) -> None:
+        if self._pwm is not None:
+            self._pwm.deinit()
+            self._pwm = None
+
+    def deinit(self) -> None:
+        """Stop playing and release the pin"""
+        self.stop()
@@ -0,0 +1,521 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_funhouse.telemetry`
+================================================================================
+
+Telemetry helpers for the Adafruit FunHouse board.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit FunHouse <https://www.adafruit.com/product/4985>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+import struct
+import time
+
+try:
+    from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FunHouse.git"
+
+_STORE_MAGIC = b"FHSF"
+# Magic, record size, capacity, index of the oldest record and record count
+_STORE_HEADER = "<4sHHHH"
+
+
+class PublishQueue:
+    """Collects values per feed and sends them in batches. A value written to a feed that is
+    already queued replaces the queued value, so only the latest value of each feed is sent.
+    The queue is flushed when it holds ``max_size`` feeds or when its oldest value is
+    ``max_age`` seconds old.
+
+    :param publish: The function called with ``(feed, value)`` to send a single value.
+    :param int max_size: The number of queued feeds that triggers a flush. Defaults to 8.
+    :param float max_age: The age of the oldest queued value, in seconds, that triggers a
+                          flush. Defaults to 10.
+    :param publish_group: The function called with a ``{feed: value}`` dict to send all of the
+                          queued values in one message. Defaults to ``None``, to send each
+                          value with ``publish``.
+
+    Attributes:
+        coalesced (int): The number of queued values replaced by a newer value.
+        flushes (int): The number of times the queue has been flushed.
+        messages (int): The number of messages sent.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[str, Any], None],
+        *,
+        max_size: int = 8,
+        max_age: float = 10,
+        publish_group: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
+        self._publish = publish
+        self._publish_group = publish_group
+        self.max_size = max_size
+        self.max_age = max_age
+        self._values = {}
+        self._oldest = None
+        self.coalesced = 0
+        self.flushes = 0
+        self.messages = 0
+
+    def put(self, feed: str, value: Union[str, int, float]) -> None:
+        """Queue a value for a feed and flush if the queue is full
+
+        :param str feed: The feed or topic to publish to.
+        :param value: The value to publish.
+        """
+        if feed in self._values:
+            self.coalesced += 1
+        elif self._oldest is None:
+            self._oldest = time.monotonic()
+        self._values[feed] = value
+        if len(self._values) >= self.max_size:
+            self.flush()
+
+    def poll(self) -> None:
+        """Flush the queue if its oldest value has reached ``max_age``"""
+        if self._oldest is not None and time.monotonic() - self._oldest >= self.max_age:
+            self.flush()
+
+    def flush(self) -> None:
+        """Send every queued value now"""
+        if not self._values:
+            return
+        values = self._values
+        self._values = {}
+        self._oldest = None
+        self.flushes += 1
+        if self._publish_group is not None:
+            self._publish_group(values)
+            self.messages += 1
+        else:
+            for feed, value in values.items():
+                self._publish(feed, value)
+                self.messages += 1
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class StoreAndForward:
+    """A bounded ring buffer of ``(feed, value, timestamp)`` records kept in a file, so
+    telemetry that could not be sent survives an outage and a reload. When the buffer is full
+    the oldest record is overwritten. Records have a fixed size: feed keys are limited to
+    ``feed_size`` bytes and values, which are stored as text, to ``value_size`` bytes.
+
+    The CircuitPython filesystem must be writable from code to use a file, see
+    https://learn.adafruit.com/circuitpython-essentials/circuitpython-storage. With
+    ``path=None`` the buffer is a preallocated ``bytearray`` instead.
+
+    :param str path: The file to keep the records in. Defaults to ``"/telemetry.bin"``.
+    :param int capacity: The number of records to keep. Defaults to 256.
+    :param int feed_size: The largest feed key, in bytes. Defaults to 32.
+    :param int value_size: The largest value text, in bytes. Defaults to 16.
+
+    Attributes:
+        dropped (int): The number of records overwritten because the buffer was full.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = "/telemetry.bin",
+        *,
+        capacity: int = 256,
+        feed_size: int = 32,
+        value_size: int = 16,
+    ) -> None:
+        self._path = path
+        self._feed_size = feed_size
+        self._value_size = value_size
+        self._format = f"<I{feed_size}s{value_size}s"
+        self._record_size = struct.calcsize(self._format)
+        self.capacity = capacity
+        self._head = 0
+        self._count = 0
+        self.dropped = 0
+        self._memory = None
+        if path is None:
+            self._memory = bytearray(capacity * self._record_size)
+            return
+        try:
+            with open(path, "rb") as file:
+                magic, record_size, stored_capacity, head, count = struct.unpack(
+                    _STORE_HEADER, file.read(struct.calcsize(_STORE_HEADER))
+                )
+            if (
+                magic == _STORE_MAGIC
+                and record_size == self._record_size
+                and stored_capacity == capacity
+            ):
+                self._head = head
+                self._count = count
+                return
+        except (OSError, ValueError):
+            pass
+        # Missing or incompatible file, start a new one
+        with open(path, "wb") as file:
+            file.write(self._header())
+            file.write(bytes(capacity * self._record_size))
+
+    def _header(self) -> bytes:
+        return struct.pack(
+            _STORE_HEADER, _STORE_MAGIC, self._record_size, self.capacity, self._head, self._count
+        )
+
+    def _offset(self, index: int) -> int:
+        return ((self._head + index) % self.capacity) * self._record_size
+
+    def _write(self, index: int, record: bytes) -> None:
+        offset = self._offset(index)
+        if self._memory is not None:
+            self._memory[offset : offset + self._record_size] = record
+            return
+        with open(self._path, "r+b") as file:
+            file.seek(struct.calcsize(_STORE_HEADER) + offset)
+            file.write(record)
+            file.seek(0)
+            file.write(self._header())
+
+    def _save_header(self) -> None:
+        if self._memory is None:
+            with open(self._path, "r+b") as file:
+                file.write(self._header())
+
+    def append(
+        self, feed: str, value: Union[str, int, float], timestamp: Optional[int] = None
+    ) -> None:
+        """Add a record, overwriting the oldest one if the buffer is full
+
+        :param str feed: The feed or topic the value was meant for.
+        :param value: The value to keep.
+        :param int timestamp: The time of the value in seconds since the epoch. Defaults to
+                              `time.time()`.
+        """
+        feed_bytes = feed.encode()
+        value_bytes = str(value).encode()
+        if len(feed_bytes) > self._feed_size or len(value_bytes) > self._value_size:
+            raise ValueError(f"The value for {feed} is too long to store")
+        record = struct.pack(
+            self._format,
+            int(time.time() if timestamp is None else timestamp),
+            feed_bytes,
+            value_bytes,
+        )
+        if self._count < self.capacity:
+            self._count += 1
+        else:
+            # Full, so the new record replaces the oldest
+            self._head = (self._head + 1) % self.capacity
+            self.dropped += 1
+        self._write(self._count - 1, record)
+
+    def peek(self, count: int) -> list:
+        """Return up to ``count`` of the oldest records as ``(feed, value, timestamp)``
+        tuples without removing them
+
+        :param int count: The largest number of records to return.
+        """
+        records = []
+        size = self._record_size
+        if self._memory is not None:
+            for index in range(min(count, self._count)):
+                offset = self._offset(index)
+                records.append(self._unpack(self._memory[offset : offset + size]))
+            return records
+        header_size = struct.calcsize(_STORE_HEADER)
+        with open(self._path, "rb") as file:
+            for index in range(min(count, self._count)):
+                file.seek(header_size + self._offset(index))
+                records.append(self._unpack(file.read(size)))
+        return records
+
+    def _unpack(self, record: bytes) -> tuple:
+        timestamp, feed, value = struct.unpack(self._format, record)
+        return (
+            feed.rstrip(b"\x00").decode(),
+            value.rstrip(b"\x00").decode(),
+            timestamp,
+        )
+
+    def discard(self, count: int) -> None:
+        """Remove up to ``count`` of the oldest records
+
+        :param int count: The number of records to remove.
+        """
+        count = min(count, self._count)
+        self._head = (self._head + count) % self.capacity
+        self._count -= count
+        self._save_header()
+
+    def replay(self, publish: Callable[[str, str, int], None], batch_size: int = 16) -> int:
+        """Send up to ``batch_size`` of the oldest records with ``publish`` and remove the ones
+        that were sent. Sending stops at the first record that raises an exception.
+        Return the number of records sent.
+
+        :param publish: The function called with ``(feed, value, timestamp)`` for each
+                        record, with the timestamp in seconds since the epoch. It must raise
+                        an exception if the value could not be sent.
+        :param int batch_size: The largest number of records to send. Defaults to 16.
+        """
+        sent = 0
+        try:
+            for feed, value, timestamp in self.peek(batch_size):
+                publish(feed, value, timestamp)
+                sent += 1
+        finally:
+            if sent:
+                self.discard(sent)
+        return sent
+
+    def clear(self) -> None:
+        """Remove every record"""
+        self._head = 0
+        self._count = 0
+        self._save_header()
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class ReportingPolicy:
+    """Decides whether a new value for a feed is worth sending. A value is sent when it moves
+    further than the deadband from the last value sent, but never sooner than ``min_interval``
+    after it, and always once ``heartbeat`` seconds have passed. Values that are not numbers
+    are sent whenever they change.
+
+    :param float deadband: The smallest change that is sent. Defaults to 0, to send any change.
+    :param float percent: The smallest change that is sent, as a percentage of the last value
+                          sent. Defaults to 0.
+    :param float min_interval: The shortest time between two values, in seconds. Defaults to 0.
+    :param float heartbeat: The longest time between two values, in seconds. Defaults to
+                            ``None``, to only send changes.
+
+    Attributes:
+        sent (int): The number of values that were committed as sent.
+        suppressed (int): The number of values that were dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        deadband: float = 0,
+        percent: float = 0,
+        min_interval: float = 0,
+        heartbeat: Optional[float] = None,
+    ) -> None:
+        self.deadband = deadband
+        self.percent = percent
+        self.min_interval = min_interval
+        self.heartbeat = heartbeat
+        self._last_value = None
+        self._last_time = None
+        self.sent = 0
+        self.suppressed = 0
+
+    def _changed(self, value: Any) -> bool:
+        last = self._last_value
+        if isinstance(value, (int, float)) and isinstance(last, (int, float)):
+            return abs(value - last) > max(self.deadband, abs(last) * self.percent / 100)
+        return value != last
+
+    def check(self, value: Any, now: Optional[float] = None) -> bool:
+        """Return whether ``value`` should be sent, without remembering it. Call `commit`
+        once it has been sent.
+
+        :param value: The new value.
+        :param float now: The `time.monotonic()` value to use. Defaults to reading the clock.
+        """
+        if now is None:
+            now = time.monotonic()
+        if self._last_time is not None:
+            elapsed = now - self._last_time
+            if elapsed < self.min_interval or (
+                not (self.heartbeat is not None and elapsed >= self.heartbeat)
+                and not self._changed(value)
+            ):
+                self.suppressed += 1
+                return False
+        return True
+
+    def commit(self, value: Any, now: Optional[float] = None) -> None:
+        """Remember ``value`` as the last value sent
+
+        :param value: The value that was sent.
+        :param float now: The `time.monotonic()` value to use. Defaults to reading the clock.
+        """
+        self._last_value = value
+        self._last_time = time.monotonic() if now is None else now
+        self.sent += 1
+
+    def allow(self, value: Any, now: Optional[float] = None) -> bool:
+        """Return whether ``value`` should be sent, and if so remember it as the last value
+
+        :param value: The new value.
+        :param float now: The `time.monotonic()` value to use. Defaults to reading the clock.
+        """
+        if now is None:
+            now = time.monotonic()
+        if not self.check(value, now):
+            return False
+        self.commit(value, now)
+        return True
+
+    def reset(self) -> None:
+        """Forget the last value so the next value is always sent"""
+        self._last_value = None
+        self._last_time = None
+
+
+class DutyCycle:
+    """Decides when the WiFi radio should be powered. The radio is on for a ``window`` once
+    every ``period`` seconds, starting with the first check, and a window is also started
+    early when ``queue_threshold`` values are waiting to be sent.
+
+    :param float period: The time from the start of one window to the start of the next, in
+                         seconds. Defaults to 300.
+    :param float window: How long the radio stays on each time, in seconds. Defaults to 30.
+    :param int queue_threshold: The number of waiting values that starts a window early.
+                                Defaults to ``None``, to only follow the schedule.
+
+    Attributes:
+        connects (int): The number of times the network was connected.
+    """
+
+    def __init__(
+        self,
+        *,
+        period: float = 300,
+        window: float = 30,
+        queue_threshold: Optional[int] = None,
+    ) -> None:
+        self.period = period
+        self.window = window
+        self.queue_threshold = queue_threshold
+        self._window_start = None
+        self._next_window = None
+        self._radio_on_since = None
+        self._radio_on_time = 0
+        self.connects = 0
+
+    def should_be_on(self, pending: int = 0, now: Optional[float] = None) -> bool:
+        """Return whether the radio should be on now, starting a window if one is due
+
+        :param int pending: The number of values waiting to be sent. Defaults to 0.
+        :param float now: The `time.monotonic()` value to use. Defaults to reading the clock.
+        """
+        if now is None:
+            now = time.monotonic()
+        if self._window_start is not None:
+            if now - self._window_start < self.window:
+                return True
+            self._window_start = None
+        if (
+            self._next_window is None
+            or now >= self._next_window
+            or (self.queue_threshold is not None and pending >= self.queue_threshold)
+        ):
+            self._window_start = now
+            self._next_window = now + self.period
+            return True
+        return False
+
+    def radio_changed(self, enabled: bool, now: Optional[float] = None) -> None:
+        """Record that the radio was turned on or off, to measure `radio_on_time`
+
+        :param bool enabled: Whether the radio is now on.
+        :param float now: The `time.monotonic()` value to use. Defaults to reading the clock.
+        """
+        if now is None:
+            now = time.monotonic()
+        if enabled and self._radio_on_since is None:
+            self._radio_on_since = now
+        elif not enabled and self._radio_on_since is not None:
+            self._radio_on_time += now - self._radio_on_since
+            self._radio_on_since = None
+
+    @property
+    def radio_on_time(self) -> float:
+        """
+        Return the total time the radio has been on, in seconds
+        """
+        if self._radio_on_since is None:
+            return self._radio_on_time
+        return self._radio_on_time + time.monotonic() - self._radio_on_since
+
+
+class FrameCodec:
+    """Packs several readings and a timestamp into a small fixed layout binary frame, and
+    unpacks them again. A frame is a schema byte, a 32 bit timestamp and one packed number
+    per field, so temperature, humidity, pressure and light fit in 13 bytes instead of one
+    text message each. Integer fields are multiplied by their scale before packing, so
+    ``("temperature", "h", 100)`` keeps two decimals in two bytes.
+
+    Frames are little endian with standard sizes and no padding: byte 0 is the schema as an
+    unsigned byte, bytes 1 to 4 are the timestamp as an unsigned 32 bit int, and the fields
+    follow in order, each packed with its format character. Importing this class runs the
+    ``adafruit_funhouse`` package, which needs the board, so to decode frames on a computer
+    use ``examples/funhouse_frame_decoder.py``, which only needs `struct` and takes the
+    same field list.
+
+    :param fields: A sequence of ``(name, format, scale)`` tuples, where ``format`` is a
+                   `struct` format character such as ``"h"``, ``"H"``, ``"i"`` or ``"f"``.
+    :param int schema: A number from 0 to 255 written to each frame, so frames packed with a
+                       different layout are rejected when decoded. Defaults to 1.
+    """
+
+    def __init__(self, fields: Sequence[Tuple[str, str, float]], *, schema: int = 1) -> None:
+        self.fields = tuple(fields)
+        self.schema = schema
+        self._format = "<BI" + "".join(fmt for _, fmt, _ in self.fields)
+        self.size = struct.calcsize(self._format)
+
+    def encode(self, values: Dict[str, float], timestamp: Optional[int] = None) -> bytes:
+        """Return a frame of ``values``, which must have a value for every field
+
+        :param dict values: The readings, keyed by field name.
+        :param int timestamp: The time of the readings in seconds since the epoch. Defaults
+                              to `time.time()`.
+        """
+        packed = []
+        for name, fmt, scale in self.fields:
+            value = values[name] * scale
+            packed.append(value if fmt in "fd" else round(value))
+        return struct.pack(
+            self._format,
+            self.schema,
+            int(time.time() if timestamp is None else timestamp),
+            *packed,
+        )
+
+    def decode(self, frame: bytes) -> Tuple[int, Dict[str, float]]:
+        """Return the ``(timestamp, values)`` of a frame made by `encode`
+
+        :param bytes frame: The frame to unpack.
+        """
+        if len(frame) != self.size or frame[0] != self.schema:
+            raise ValueError("The frame does not match this layout")
+        schema_and_values = struct.unpack(self._format, frame)
+        values = {}
+        for (name, _, scale), value in zip(self.fields, schema_and_values[2:]):
+            values[name] = value / scale if scale != 1 else value
+        return schema_and_values[1], values
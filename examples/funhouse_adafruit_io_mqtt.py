@@ -2,9 +2,8 @@
 # SPDX-FileCopyrightText: Copyright (c) 2021 Melissa LeBlanc-Williams for Adafruit Industries
 #
 # SPDX-License-Identifier: MIT
-import time
-
 from adafruit_funhouse import FunHouse
+from adafruit_funhouse.routing import parse_color, parse_int
 
 funhouse = FunHouse(default_bg=None)
 funhouse.peripherals.set_dotstars(0x800000, 0x808000, 0x008000, 0x000080, 0x800080)
@@ -24,45 +23,57 @@ def disconnected(client):
     print("Disconnected from Adafruit IO!")
 
 
-def message(client, feed_id, payload):
-    print(f"Feed {feed_id} received new value: {payload}")
-    if feed_id == "buzzer":
-        if int(payload) == 1:
-            funhouse.peripherals.play_tone(2000, 0.25)
-    if feed_id == "neopixels":
-        print(payload)
-        color = int(payload[1:], 16)
-        funhouse.peripherals.dotstars.fill(color)
+def buzzer(feed_id, value):
+    print(f"Feed {feed_id} received new value: {value}")
+    if value == 1:
+        funhouse.peripherals.queue_tone(2000, 0.25)
+
+
+def neopixels(feed_id, color):
+    print(f"Feed {feed_id} received new value: {color:06X}")
+    funhouse.peripherals.frame_buffer.fill(color)
+    funhouse.peripherals.frame_buffer.show()
 
 
-# Initialize a new MQTT Client object
-funhouse.network.init_io_mqtt()
+# Initialize a new MQTT Client object, with a short timeout so tones don't stall
+funhouse.network.init_io_mqtt(socket_timeout=0.1)
 funhouse.network.on_mqtt_connect = connected
 funhouse.network.on_mqtt_disconnect = disconnected
 funhouse.network.on_mqtt_subscribe = subscribe
-funhouse.network.on_mqtt_message = message
+funhouse.network.route("buzzer", buzzer, parser=parse_int)
+funhouse.network.route("neopixels", neopixels, parser=parse_color)
+
+# Only send PIR when it changes, and the temperature when it moves by more than 0.1C
+funhouse.network.set_reporting_policy("pir")
+funhouse.network.set_reporting_policy("temperature", deadband=0.1, heartbeat=300)
 
 print("Connecting to Adafruit IO...")
 funhouse.network.mqtt_connect()
-sensorwrite_timestamp = time.monotonic()
-last_pir = None
 
-while True:
-    funhouse.network.mqtt_loop()
 
+def show_sensors():
     print(f"Temp {funhouse.peripherals.temperature:0.1F}")
     print(f"Pres {funhouse.peripherals.pressure:d}")
 
-    # every 10 seconds, write temp/hum/press
-    if (time.monotonic() - sensorwrite_timestamp) > 10:
-        funhouse.peripherals.led = True
-        print("Sending data to adafruit IO!")
-        funhouse.network.mqtt_publish("temperature", funhouse.peripherals.temperature)
-        funhouse.network.mqtt_publish("humidity", int(funhouse.peripherals.relative_humidity))
-        funhouse.network.mqtt_publish("pressure", int(funhouse.peripherals.pressure))
-        sensorwrite_timestamp = time.monotonic()
-        # Send PIR only if changed!
-        if last_pir is None or last_pir != funhouse.peripherals.pir_sensor:
-            last_pir = funhouse.peripherals.pir_sensor
-            funhouse.network.mqtt_publish("pir", f"{last_pir:d}")
-        funhouse.peripherals.led = False
+
+def send_sensors():
+    funhouse.peripherals.led = True
+    print("Sending data to adafruit IO!")
+    reading = funhouse.peripherals.read_environment()
+    funhouse.network.mqtt_publish("temperature", reading.temperature)
+    funhouse.network.mqtt_publish("humidity", int(reading.relative_humidity))
+    funhouse.network.mqtt_publish("pressure", int(reading.pressure))
+    funhouse.network.mqtt_publish("pir", f"{funhouse.peripherals.pir_sensor:d}")
+    funhouse.peripherals.led = False
+
+
+def mqtt_loop():
+    funhouse.network.mqtt_loop(timeout=0.1)
+
+
+funhouse.every(0.05, mqtt_loop, priority=2)
+funhouse.every(0.01, funhouse.peripherals.update_tones, priority=1)
+funhouse.every(1, show_sensors)
+# every 10 seconds, write temp/hum/press
+funhouse.every(10, send_sensors)
+funhouse.run()
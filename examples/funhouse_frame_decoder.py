@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+This example runs on a computer, not on the FunHouse. It decodes the binary frames that
+``funhouse.network.mqtt_publish_frame()`` sends, using only Python's ``struct`` module, so it
+doesn't need the FunHouse library or any board modules. Copy the same field list that was
+passed to ``funhouse.network.init_frame_codec()`` into FIELDS.
+
+Pass frames as hex on the command line, for example with a frame saved by an MQTT client:
+
+    python3 funhouse_frame_decoder.py 0100b95569290918109427fa0a
+"""
+
+import struct
+import sys
+
+# The (name, format, scale) fields and schema used with init_frame_codec() on the FunHouse
+FIELDS = (
+    ("temperature", "h", 100),
+    ("humidity", "H", 100),
+    ("pressure", "H", 10),
+    ("light", "H", 1),
+)
+SCHEMA = 1
+
+
+class FrameDecoder:
+    """Decodes frames made by a FrameCodec with the same fields and schema"""
+
+    def __init__(self, fields, schema=1):
+        self.fields = tuple(fields)
+        self.schema = schema
+        # A schema byte, a 32 bit timestamp, then each field, little endian without padding
+        self.format = "<BI" + "".join(fmt for _, fmt, _ in self.fields)
+        self.size = struct.calcsize(self.format)
+
+    def decode(self, frame):
+        """Return the (timestamp, values) of a frame"""
+        if len(frame) != self.size or frame[0] != self.schema:
+            raise ValueError("The frame does not match this layout")
+        schema_and_values = struct.unpack(self.format, frame)
+        values = {}
+        for (name, _, scale), value in zip(self.fields, schema_and_values[2:]):
+            values[name] = value / scale if scale != 1 else value
+        return schema_and_values[1], values
+
+
+decoder = FrameDecoder(FIELDS, SCHEMA)
+for hex_frame in sys.argv[1:]:
+    timestamp, readings = decoder.decode(bytes.fromhex(hex_frame))
+    print(timestamp, readings)
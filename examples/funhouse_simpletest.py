@@ -14,6 +14,10 @@ funhouse = FunHouse(
 
 funhouse.peripherals.set_dotstars(0x800000, 0x808000, 0x008000, 0x000080, 0x800080)
 
+# The environmental sensors change slowly, so reuse their readings for a second
+funhouse.peripherals.aht20_cache.max_age = 1
+funhouse.peripherals.dps310_cache.max_age = 1
+
 # sensor setup
 sensors = []
 for p in (board.A0, board.A1, board.A2):
@@ -58,7 +62,7 @@ while True:
 
     slider = funhouse.peripherals.slider
     if slider is not None:
-        funhouse.peripherals.dotstars.brightness = slider
+        funhouse.peripherals.dotstar_brightness = slider
         funhouse.set_text(f"Slider: {slider:1.1f}", slider_label)
     set_label_color(slider is not None, slider_label, 0xFFFF00)
 
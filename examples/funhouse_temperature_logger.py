@@ -23,18 +23,23 @@ funhouse.peripherals.dotstars.fill(0)
 funhouse.display.brightness = 0
 funhouse.network.enabled = False
 
+# Set the clock to UTC so the samples get the right timestamps
+funhouse.network.enabled = True
+funhouse.get_local_time("Etc/UTC")
+funhouse.network.enabled = False
+
+# Only turn WiFi on to upload every 10 readings
+funhouse.init_io_batch(upload_every=10)
+
 
 def log_data():
     print("Logging Temperature")
-    print("Temperature %0.1F" % (funhouse.peripherals.temperature - TEMPERATURE_OFFSET))
-    # Turn on WiFi
-    funhouse.network.enabled = True
-    # Connect to WiFi
-    funhouse.network.connect()
-    # Push to IO using REST
-    funhouse.push_to_io(FEED, funhouse.peripherals.temperature - TEMPERATURE_OFFSET)
-    # Turn off WiFi
-    funhouse.network.enabled = False
+    temperature = funhouse.peripherals.temperature - TEMPERATURE_OFFSET
+    print(f"Temperature {temperature:0.1F}")
+    funhouse.add_to_io_batch(FEED, round(temperature, 2))
+    # Push to IO using REST when enough readings were collected
+    if funhouse.upload_io_batch():
+        print("Uploaded to IO")
 
 
 while True: